@@ -4,8 +4,9 @@ import csv
 
 # Django
 from django import forms
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.db import models
+from django.db.models import Count, Q
 from django.http import HttpResponse
 
 # Alliance Auth
@@ -15,6 +16,7 @@ from .models import AutoLottery, Lottery, TicketAnomaly, Winner, WinnerDistribut
 from .models.webhook import WebhookConfiguration
 from .notifications import notify_alliance as send_alliance_auth_notification
 from .notifications import notify_discord_or_fallback
+from .simulation import numpy_available, simulate_lottery
 
 logger = get_extension_logger(__name__)
 
@@ -358,6 +360,7 @@ class LotteryAdmin(ExportCSVMixin, FortunaiskModelAdmin):
         "duration_value",
         "duration_unit",
         "winner_count",
+        "draw_mode",
         "max_tickets_per_user",
         "payment_receiver",
         "lottery_reference",
@@ -378,10 +381,17 @@ class LotteryAdmin(ExportCSVMixin, FortunaiskModelAdmin):
         "duration_value",
         "duration_unit",
         "winner_count",
+        "draw_mode",
         "max_tickets_per_user",
         "payment_receiver",
     ]
-    actions = ["mark_completed", "mark_cancelled", "terminate_lottery", "export_as_csv"]
+    actions = [
+        "mark_completed",
+        "mark_cancelled",
+        "terminate_lottery",
+        "export_as_csv",
+        "simulate_odds",
+    ]
 
     def has_add_permission(self, request):
         """
@@ -395,18 +405,78 @@ class LotteryAdmin(ExportCSVMixin, FortunaiskModelAdmin):
         """
         return False
 
-    @admin.display(description="Number of Participants")
+    def get_queryset(self, request):
+        """
+        Annotate participant counts from the per-user ticket counters.
+
+        Args:
+            request: The current HTTP request
+
+        Returns:
+            Annotated queryset of lotteries
+        """
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                participant_count=Count(
+                    "ticket_counters", filter=Q(ticket_counters__quantity__gt=0)
+                )
+            )
+        )
+
+    @admin.display(description="Number of Participants", ordering="participant_count")
     def participant_count(self, obj):
         """
-        Calculate the number of participants for display.
+        Number of participants for display.
+
+        Args:
+            obj: Lottery instance (annotated by get_queryset)
+
+        Returns:
+            Count of users holding at least one ticket
+        """
+        return obj.participant_count
+
+    @admin.action(description="Simulate odds of selected (CSV)")
+    def simulate_odds(self, request, queryset):
+        """
+        Action to simulate 100,000 draws of each selected lottery with its
+        current tickets and export per-participant odds as CSV.
 
         Args:
-            obj: Lottery instance
+            request: The current HTTP request
+            queryset: Selected lotteries
 
         Returns:
-            Count of ticket purchases
+            HttpResponse containing CSV data, or None if NumPy is missing
         """
-        return obj.ticket_purchases.count()
+        if not numpy_available():
+            self.message_user(
+                request,
+                "The odds simulator requires NumPy (pip install fortunaisk[simulator]).",
+                level=messages.ERROR,
+            )
+            return None
+        resp = HttpResponse(content_type="text/csv")
+        resp["Content-Disposition"] = 'attachment; filename="lottery_odds.csv"'
+        writer = csv.writer(resp)
+        writer.writerow(
+            [
+                "lottery_reference",
+                "participant",
+                "tickets",
+                "cost",
+                "win_probability",
+                "expected_payout",
+                "expected_return",
+                "payout_std",
+            ]
+        )
+        for lot in queryset:
+            for odds in simulate_lottery(lot):
+                writer.writerow([lot.lottery_reference, *odds])
+        return resp
 
     @admin.action(description="Mark selected as completed")
     def mark_completed(self, request, queryset):
@@ -564,6 +634,7 @@ class AutoLotteryAdmin(ExportCSVMixin, FortunaiskModelAdmin):
         "duration_value",
         "duration_unit",
         "winner_count",
+        "draw_mode",
         "winners_distribution",
         "payment_receiver",
         "max_tickets_per_user",
@@ -0,0 +1,55 @@
+# fortunaisk/app_settings.py
+
+# Django
+from django.conf import settings
+
+# Maximum number of wallet journal entries handled by a single payment
+# processing task. Pending payments are grouped by lottery reference and split
+# into chunks of this size, one Celery message per chunk.
+FORTUNAISK_PAYMENT_CHUNK_SIZE = max(
+    1, int(getattr(settings, "FORTUNAISK_PAYMENT_CHUNK_SIZE", 200))
+)
+
+# Number of Celery queues payments are partitioned into by lottery reference.
+# Each queue must be consumed by exactly one worker process (concurrency 1),
+# e.g. `celery worker -Q fortunaisk_payments_0 -c 1`, so that payments of one
+# lottery are processed sequentially and without row locks. 0 disables
+# partitioning and uses the default queue with row locking.
+FORTUNAISK_PAYMENT_PARTITIONS = max(
+    0, int(getattr(settings, "FORTUNAISK_PAYMENT_PARTITIONS", 0))
+)
+
+# Prefix of the partition queue names (suffixed with the partition index).
+FORTUNAISK_PAYMENT_QUEUE_PREFIX = getattr(
+    settings, "FORTUNAISK_PAYMENT_QUEUE_PREFIX", "fortunaisk_payments_"
+)
+
+# Winner draw backend: "python" streams (id, quantity) rows through a one-pass
+# weighted reservoir; "database" picks random ticket numbers and resolves them
+# to purchases with a cumulative SUM() OVER window query, recording the drawn
+# ticket number on each Winner.
+FORTUNAISK_DRAW_BACKEND = getattr(settings, "FORTUNAISK_DRAW_BACKEND", "python")
+
+# Discord webhook fan-out: the number of threads sending one notification to
+# its subscribed webhooks concurrently (over a shared keep-alive HTTP session),
+# and the timeout in seconds of each webhook POST.
+FORTUNAISK_WEBHOOK_WORKERS = max(
+    1, int(getattr(settings, "FORTUNAISK_WEBHOOK_WORKERS", 4))
+)
+FORTUNAISK_WEBHOOK_TIMEOUT = float(getattr(settings, "FORTUNAISK_WEBHOOK_TIMEOUT", 5))
+
+# Notification outbox: rows delivered per drain transaction, and the number of
+# delivery attempts (with exponential backoff from 30 s, capped at one hour)
+# before a row is marked "failed".
+FORTUNAISK_OUTBOX_BATCH_SIZE = max(
+    1, int(getattr(settings, "FORTUNAISK_OUTBOX_BATCH_SIZE", 50))
+)
+FORTUNAISK_OUTBOX_MAX_ATTEMPTS = max(
+    1, int(getattr(settings, "FORTUNAISK_OUTBOX_MAX_ATTEMPTS", 6))
+)
+
+# Notification digest window in seconds. When > 0, ticket purchase and anomaly
+# notifications wait this long in the outbox and every pending notification of
+# the same user/channel is delivered as one combined message with totals.
+# 0 disables digests.
+FORTUNAISK_DIGEST_WINDOW = max(0, int(getattr(settings, "FORTUNAISK_DIGEST_WINDOW", 0)))
@@ -0,0 +1,158 @@
+# fortunaisk/draw.py
+
+# Standard Library
+import heapq
+import math
+import random
+from decimal import Decimal
+
+
+def _uniform_open(rng) -> float:
+    """Uniform random number in (0, 1]."""
+    return 1.0 - rng.random()
+
+
+def _next_trigger(end, log_key, rng) -> float:
+    """
+    Cumulative weight at which a reservoir slot is replaced next.
+
+    Exponential jump of A-ExpJ: with key T = exp(log_key), the slot skips
+    log(u) / log(T) units of weight after the item ending at `end`.
+    """
+    if log_key == 0:
+        return math.inf
+    return end + math.log(_uniform_open(rng)) / log_key
+
+
+def weighted_choices_stream(stream, k, rng=random) -> list:
+    """
+    Weighted random draws with replacement, in one pass over a stream.
+
+    Equivalent to `random.choices(items, weights, k=k)`, but the stream of
+    `(item, weight)` pairs is consumed once and only O(k) state is kept, so
+    it can read straight from a database cursor.
+
+    Each of the k draws is an independent single-item weighted reservoir
+    using exponential jumps (A-ExpJ with a reservoir of one). The k slots
+    are kept in a heap ordered by the cumulative weight at which they are
+    replaced next, so an item costs O(1) unless it replaces a slot, which
+    only happens O(log(total weight)) times per slot.
+
+    Args:
+        stream: Iterable of (item, weight) pairs, weights >= 0
+        k: Number of draws
+        rng: Random generator (module `random` by default)
+
+    Returns:
+        list: k drawn items (empty if the stream has no positive weight)
+    """
+    if k <= 0:
+        return []
+    slots = [None] * k
+    log_keys = [0.0] * k
+    heap = []
+    position = 0
+
+    for item, weight in stream:
+        if not weight or weight <= 0:
+            continue
+        end = position + weight
+        if not heap:
+            # First positive item fills every slot
+            for slot in range(k):
+                slots[slot] = item
+                log_keys[slot] = math.log(_uniform_open(rng)) / weight
+                heap.append((_next_trigger(end, log_keys[slot], rng), slot))
+            heapq.heapify(heap)
+        else:
+            while heap[0][0] <= end:
+                _, slot = heapq.heappop(heap)
+                # New key drawn from (T^weight, 1), then raised to 1/weight
+                low = math.exp(weight * log_keys[slot])
+                log_keys[slot] = math.log(rng.uniform(low, 1.0)) / weight
+                slots[slot] = item
+                heapq.heappush(heap, (_next_trigger(end, log_keys[slot], rng), slot))
+        position = end
+
+    return slots if heap else []
+
+
+def weighted_sample_stream(stream, k, rng=random) -> list:
+    """
+    Weighted random sample of k distinct items, in one pass over a stream.
+
+    Efraimidis–Spirakis sampling without replacement (A-ExpJ variant): each
+    item gets the key u ** (1 / weight) and the k largest keys win. The
+    reservoir is a min-heap of size k and exponential jumps skip items that
+    cannot enter it, so the cost is O(n) plus O(log k) per heap update and
+    the memory is O(k).
+
+    Args:
+        stream: Iterable of (item, weight) pairs, weights >= 0
+        k: Sample size
+        rng: Random generator (module `random` by default)
+
+    Returns:
+        list: Up to k distinct items, in draw order (largest key first)
+    """
+    if k <= 0:
+        return []
+    # (log key, sequence, item); sequence breaks ties without comparing items
+    heap = []
+    trigger = math.inf
+    position = 0
+    seq = 0
+
+    for item, weight in stream:
+        if not weight or weight <= 0:
+            continue
+        end = position + weight
+        if len(heap) < k:
+            heapq.heappush(heap, (math.log(_uniform_open(rng)) / weight, seq, item))
+            if len(heap) == k:
+                trigger = _next_trigger(end, heap[0][0], rng)
+        elif trigger <= end:
+            # Replace the smallest key with a key drawn above it
+            low = math.exp(weight * heap[0][0])
+            log_key = math.log(rng.uniform(low, 1.0)) / weight
+            heapq.heapreplace(heap, (log_key, seq, item))
+            trigger = _next_trigger(end, heap[0][0], rng)
+        seq += 1
+        position = end
+
+    return [item for _, _, item in sorted(heap, reverse=True)]
+
+
+def prize_allocations(pot, percentages, n_winners) -> list:
+    """
+    Splits a net pot between `n_winners` ranked winners.
+
+    The configured percentages are used when there is one per winner,
+    otherwise the pot is split evenly. Shares are rounded to the cent and
+    the last winner receives the remainder, so the shares always sum to `pot`.
+
+    Args:
+        pot: Net pot (Decimal)
+        percentages: Prize percentage per winner rank
+        n_winners: Number of winners actually drawn
+
+    Returns:
+        list: Decimal prize per winner rank
+    """
+    if n_winners <= 0:
+        return []
+    percentages = list(percentages)
+    if len(percentages) != n_winners:
+        base = (Decimal("100") / n_winners).quantize(Decimal("0.01"))
+        percentages = [base] * n_winners
+        percentages[-1] = Decimal("100") - base * (n_winners - 1)
+
+    allocations, cumu = [], Decimal("0")
+    for idx, pct in enumerate(percentages):
+        share = (pot * pct / Decimal("100")).quantize(Decimal("0.01"))
+        if idx == n_winners - 1:
+            share = pot - cumu
+        else:
+            cumu += share
+        allocations.append(share)
+    return allocations
@@ -79,6 +79,7 @@ class AutoLotteryForm(forms.ModelForm):
             "duration_value",
             "duration_unit",
             "winner_count",
+            "draw_mode",
             "winners_distribution",
             "max_tickets_per_user",
             "payment_receiver",
@@ -127,6 +128,7 @@ class AutoLotteryForm(forms.ModelForm):
                     "placeholder": _("E.g. 3"),
                 }
             ),
+            "draw_mode": forms.Select(attrs={"class": "form-select"}),
             "max_tickets_per_user": forms.NumberInput(
                 attrs={
                     "min": 1,
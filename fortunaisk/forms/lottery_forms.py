@@ -78,6 +78,7 @@ class LotteryCreateForm(forms.ModelForm):
             "duration_value",
             "duration_unit",
             "winner_count",
+            "draw_mode",
             "max_tickets_per_user",
             "payment_receiver",
         ]
@@ -96,6 +97,7 @@ class LotteryCreateForm(forms.ModelForm):
             "winner_count": forms.NumberInput(
                 attrs={"min": "1", "class": "form-control", "placeholder": _("E.g. 3")}
             ),
+            "draw_mode": forms.Select(attrs={"class": "form-select"}),
             "max_tickets_per_user": forms.NumberInput(
                 attrs={
                     "min": "1",
@@ -0,0 +1,121 @@
+# fortunaisk/identity.py
+
+# Standard Library
+import uuid
+from typing import NamedTuple
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+
+
+class PayerIdentity(NamedTuple):
+    """Resolved identity of a paying EVE character."""
+
+    character_pk: int | None
+    user_id: int | None
+    failure: str | None = None
+
+    @property
+    def resolved(self) -> bool:
+        return self.failure is None
+
+
+# Shared cache: token of the current identity generation, then
+# "<prefix><token>_<character_id>" -> (character pk, user id) per resolved payer
+IDENTITY_TOKEN_KEY = "fortunaisk_payer_identity_token"
+IDENTITY_KEY_PREFIX = "fortunaisk_payer_identity_"
+IDENTITY_TTL = 300
+
+
+def _identity_token() -> str:
+    """Token of the current identity generation, created on first use."""
+    token = cache.get(IDENTITY_TOKEN_KEY)
+    if token is None:
+        token = uuid.uuid4().hex
+        if not cache.add(IDENTITY_TOKEN_KEY, token, None):
+            token = cache.get(IDENTITY_TOKEN_KEY) or token
+    return token
+
+
+def resolve_payers(character_ids) -> dict:
+    """
+    Resolve EVE character ids to the auth user that owns them.
+
+    Resolved payers are kept in the shared Django cache, so every worker
+    sees an ownership change as soon as `clear_identity_cache` rotates the
+    cache token. Misses are loaded with one joined CharacterOwnership →
+    UserProfile query. Characters without an ownership are looked up once
+    more so the caller can still tell a missing EveCharacter from a missing
+    ownership. Only fully resolved payers are cached.
+
+    Args:
+        character_ids: Iterable of EVE character ids
+
+    Returns:
+        dict: character_id -> PayerIdentity, for every requested id
+    """
+    CharacterOwnership = apps.get_model("authentication", "CharacterOwnership")
+    EveCharacter = apps.get_model("eveonline", "EveCharacter")
+
+    character_ids = set(character_ids)
+    prefix = f"{IDENTITY_KEY_PREFIX}{_identity_token()}_"
+    cached = cache.get_many([f"{prefix}{char_id}" for char_id in character_ids])
+    found = {
+        char_id: PayerIdentity(*cached[f"{prefix}{char_id}"])
+        for char_id in character_ids
+        if f"{prefix}{char_id}" in cached
+    }
+    missing = character_ids - found.keys()
+    if not missing:
+        return found
+
+    rows = CharacterOwnership.objects.filter(
+        character__character_id__in=missing
+    ).values_list(
+        "character__character_id",
+        "character_id",
+        "user_id",
+        "user__profile__id",
+    )
+    resolved = {}
+    for char_id, char_pk, user_id, profile_id in rows:
+        if profile_id is None:
+            found[char_id] = PayerIdentity(char_pk, user_id, "Profile missing")
+            continue
+        found[char_id] = PayerIdentity(char_pk, user_id)
+        resolved[f"{prefix}{char_id}"] = (char_pk, user_id)
+    if resolved:
+        cache.set_many(resolved, IDENTITY_TTL)
+
+    orphans = missing - found.keys()
+    if orphans:
+        known = dict(
+            EveCharacter.objects.filter(character_id__in=orphans).values_list(
+                "character_id", "pk"
+            )
+        )
+        for char_id in orphans:
+            if char_id in known:
+                found[char_id] = PayerIdentity(
+                    known[char_id], None, "Ownership missing"
+                )
+            else:
+                found[char_id] = PayerIdentity(None, None, "EveCharacter missing")
+    return found
+
+
+def _rotate_identity_token():
+    cache.set(IDENTITY_TOKEN_KEY, uuid.uuid4().hex, None)
+
+
+def clear_identity_cache():
+    """
+    Forget every cached payer identity, in all processes.
+
+    The token is rotated now and again on commit, so identities cached by
+    another worker from the not-yet-committed state are not kept.
+    """
+    _rotate_identity_token()
+    transaction.on_commit(_rotate_identity_token)
@@ -0,0 +1,30 @@
+# fortunaisk/management/commands/rebuild_fortuna_ticket_counters.py
+
+# Standard Library
+import logging
+
+# Django
+from django.core.management.base import BaseCommand
+
+# fortunaisk
+from fortunaisk.models import TicketCounter
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-(lottery, user) ticket counters from ticket purchases"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lottery",
+            type=int,
+            action="append",
+            dest="lottery_ids",
+            help="Only rebuild counters of this lottery id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        written = TicketCounter.rebuild(lottery_ids=options["lottery_ids"])
+        self.stdout.write(self.style.SUCCESS(f"{written} ticket counters rebuilt."))
+        logger.info(f"Ticket counters rebuilt: {written} rows.")
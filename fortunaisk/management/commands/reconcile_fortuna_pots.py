@@ -0,0 +1,43 @@
+# fortunaisk/management/commands/reconcile_fortuna_pots.py
+
+# Standard Library
+import logging
+
+# Django
+from django.core.management.base import BaseCommand
+
+# fortunaisk
+from fortunaisk.tasks import reconcile_pots
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute active/pending lottery pots from ticket purchases and report drift"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drift, do not correct stored pots.",
+        )
+
+    def handle(self, *args, **options):
+        drifts = reconcile_pots(fix=not options["dry_run"])
+        for drift in drifts:
+            self.stdout.write(
+                f"{drift['lottery_reference']}: "
+                f"stored {drift['stored_total_pot']} (tax {drift['stored_tax_amount']}), "
+                f"expected {drift['expected_total_pot']} (tax {drift['expected_tax_amount']})"
+            )
+        if not drifts:
+            self.stdout.write(self.style.SUCCESS("No pot drift found."))
+        elif options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{len(drifts)} lotteries drifting."))
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"{len(drifts)} lottery pots corrected.")
+            )
+        logger.info(f"Pot reconciliation: {len(drifts)} drifting lotteries.")
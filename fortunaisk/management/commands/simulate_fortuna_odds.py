@@ -0,0 +1,96 @@
+# fortunaisk/management/commands/simulate_fortuna_odds.py
+
+# Standard Library
+import logging
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# fortunaisk
+from fortunaisk.models import AutoLottery, Lottery
+from fortunaisk.simulation import (
+    numpy_available,
+    simulate_lottery,
+    simulate_synthetic,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _ticket_list(value):
+    try:
+        tickets = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise CommandError("--tickets must be a comma-separated list of integers.")
+    if not tickets or min(tickets) < 0:
+        raise CommandError("--tickets needs at least one non-negative ticket count.")
+    return tickets
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate a lottery draw many times and report each participant's win "
+        "probability, expected value and payout spread (requires NumPy)"
+    )
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group(required=True)
+        target.add_argument("--lottery", type=int, help="Lottery id to simulate.")
+        target.add_argument(
+            "--autolottery",
+            type=int,
+            help="AutoLottery id whose configuration is simulated (needs --tickets).",
+        )
+        parser.add_argument(
+            "--tickets",
+            type=_ticket_list,
+            help=(
+                "Synthetic ticket counts per participant, e.g. 10,5,1. "
+                "Replaces the lottery's actual ticket purchases."
+            ),
+        )
+        parser.add_argument(
+            "--draws",
+            type=int,
+            default=100_000,
+            help="Number of simulated draws (default 100000).",
+        )
+        parser.add_argument("--seed", type=int, help="Seed for reproducible runs.")
+
+    def handle(self, *args, **options):
+        if not numpy_available():
+            raise CommandError(
+                "NumPy is not installed (pip install fortunaisk[simulator])."
+            )
+        model = Lottery if options["lottery"] else AutoLottery
+        pk = options["lottery"] or options["autolottery"]
+        config = model.objects.filter(pk=pk).first()
+        if config is None:
+            raise CommandError(f"{model.__name__} {pk} not found.")
+
+        if options["tickets"]:
+            results = simulate_synthetic(
+                config, options["tickets"], options["draws"], options["seed"]
+            )
+        elif model is Lottery:
+            results = simulate_lottery(config, options["draws"], options["seed"])
+        else:
+            raise CommandError("--autolottery needs a --tickets distribution.")
+
+        if not results:
+            self.stdout.write(self.style.WARNING("No tickets to simulate."))
+            return
+        self.stdout.write(
+            f"{'Participant':<30} {'Tickets':>8} {'P(win)':>8} "
+            f"{'E[payout]':>16} {'E[return]':>16} {'Std dev':>16}"
+        )
+        for odds in results:
+            self.stdout.write(
+                f"{odds.label[:30]:<30} {odds.tickets:>8} "
+                f"{odds.win_probability:>8.2%} {odds.expected_payout:>16,.2f} "
+                f"{odds.expected_return:>16,.2f} {odds.payout_std:>16,.2f}"
+            )
+        logger.info(
+            f"Simulated {options['draws']} draws of {model.__name__} {pk} "
+            f"({len(results)} participants)."
+        )
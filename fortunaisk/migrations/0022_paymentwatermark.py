@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("eveonline", "0017_alliance_and_corp_names_are_not_unique"),
+        (
+            "fortunaisk",
+            "0021_alter_autolottery_tax_alter_autolottery_tax_amount_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_date",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Date of the last journal entry scanned.",
+                        null=True,
+                        verbose_name="Last Journal Date",
+                    ),
+                ),
+                (
+                    "last_entry_id",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Entry ID of the last journal entry scanned.",
+                        verbose_name="Last Journal Entry ID",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated At"),
+                ),
+                (
+                    "corporation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fortunaisk_payment_watermark",
+                        to="eveonline.evecorporationinfo",
+                        verbose_name="Receiving Corporation",
+                    ),
+                ),
+            ],
+            options={
+                "default_permissions": (),
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:23
+
+from django.db import migrations, models
+
+
+def backfill_normalized_reference(apps, schema_editor):
+    Lottery = apps.get_model("fortunaisk", "Lottery")
+    seen = set()
+    for lot in Lottery.objects.exclude(lottery_reference__isnull=True).order_by("pk"):
+        normalized = lot.lottery_reference.strip().upper()
+        if not normalized or normalized in seen:
+            continue
+        seen.add(normalized)
+        Lottery.objects.filter(pk=lot.pk).update(normalized_reference=normalized)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0022_paymentwatermark"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lottery",
+            name="normalized_reference",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Trimmed, upper-cased reference used to match wallet payments.",
+                max_length=20,
+                null=True,
+                verbose_name="Normalized Reference",
+            ),
+        ),
+        migrations.RunPython(backfill_normalized_reference, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="lottery",
+            name="normalized_reference",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Trimmed, upper-cased reference used to match wallet payments.",
+                max_length=20,
+                null=True,
+                unique=True,
+                verbose_name="Normalized Reference",
+            ),
+        ),
+    ]
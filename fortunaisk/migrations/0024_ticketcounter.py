@@ -0,0 +1,88 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_ticket_counters(apps, schema_editor):
+    TicketPurchase = apps.get_model("fortunaisk", "TicketPurchase")
+    TicketCounter = apps.get_model("fortunaisk", "TicketCounter")
+    totals = (
+        TicketPurchase.objects.filter(status="processed")
+        .values("lottery_id", "user_id")
+        .annotate(total=models.Sum("quantity"))
+        .filter(total__gt=0)
+    )
+    TicketCounter.objects.bulk_create(
+        [
+            TicketCounter(
+                lottery_id=row["lottery_id"],
+                user_id=row["user_id"],
+                quantity=row["total"],
+            )
+            for row in totals
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("fortunaisk", "0023_lottery_normalized_reference"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "quantity",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Processed tickets held by the user across all characters.",
+                        verbose_name="Ticket Quantity",
+                    ),
+                ),
+                (
+                    "lottery",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_counters",
+                        to="fortunaisk.lottery",
+                        verbose_name="Lottery",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ticket_counters",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Django User",
+                    ),
+                ),
+            ],
+            options={
+                "default_permissions": (),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="ticketcounter",
+            constraint=models.UniqueConstraint(
+                fields=("lottery", "user"), name="unique_ticketcounter_lottery_user"
+            ),
+        ),
+        migrations.RunPython(backfill_ticket_counters, migrations.RunPython.noop),
+    ]
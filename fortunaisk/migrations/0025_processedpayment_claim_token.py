@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0024_ticketcounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processedpayment",
+            name="claim_token",
+            field=models.UUIDField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Token of the processing run that claimed this payment.",
+                null=True,
+                verbose_name="Claim Token",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0025_processedpayment_claim_token"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="winner",
+            name="ticket_number",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                help_text="Drawn ticket number (0-based, purchases ordered by id), if known.",
+                null=True,
+                verbose_name="Ticket Number",
+            ),
+        ),
+    ]
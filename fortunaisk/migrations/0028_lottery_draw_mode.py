@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0027_winner_ticket_number"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="autolottery",
+            name="draw_mode",
+            field=models.CharField(
+                choices=[
+                    (
+                        "replacement",
+                        "Independent draws (a ticket can win several prizes)",
+                    ),
+                    (
+                        "distinct",
+                        "Distinct winners (each ticket purchase wins at most once)",
+                    ),
+                ],
+                default="replacement",
+                help_text="Whether the same ticket purchase may win more than one prize.",
+                max_length=20,
+                verbose_name="Draw Mode",
+            ),
+        ),
+        migrations.AddField(
+            model_name="lottery",
+            name="draw_mode",
+            field=models.CharField(
+                choices=[
+                    (
+                        "replacement",
+                        "Independent draws (a ticket can win several prizes)",
+                    ),
+                    (
+                        "distinct",
+                        "Distinct winners (each ticket purchase wins at most once)",
+                    ),
+                ],
+                default="replacement",
+                help_text="Whether the same ticket purchase may win more than one prize.",
+                max_length=20,
+                verbose_name="Draw Mode",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:49
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0028_lottery_draw_mode"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationOutbox",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Webhook event key, empty for private notifications.",
+                        max_length=50,
+                        verbose_name="Event",
+                    ),
+                ),
+                ("title", models.CharField(blank=True, default="", max_length=255)),
+                ("message", models.TextField(blank=True, default="")),
+                ("embed", models.JSONField(blank=True, null=True)),
+                ("level", models.CharField(default="info", max_length=10)),
+                ("private", models.BooleanField(default=False)),
+                (
+                    "recipient_ids",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Ids of the users to DM (private or fallback notifications).",
+                        verbose_name="Recipients",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("failed", "Failed")],
+                        db_index=True,
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Notification Outbox Entry",
+                "verbose_name_plural": "Notification Outbox",
+                "default_permissions": (),
+            },
+        ),
+    ]
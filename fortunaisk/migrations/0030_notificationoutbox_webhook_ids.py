@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0029_notificationoutbox"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationoutbox",
+            name="webhook_ids",
+            field=models.JSONField(
+                blank=True,
+                help_text="Webhook configurations still to deliver to after a rate limit; empty means every subscribed webhook.",
+                null=True,
+                verbose_name="Pending Webhooks",
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0030_notificationoutbox_webhook_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationoutbox",
+            name="digest",
+            field=models.JSONField(
+                blank=True,
+                help_text="Title, intro, line and totals used to merge digest rows.",
+                null=True,
+                verbose_name="Digest Data",
+            ),
+        ),
+        migrations.AddField(
+            model_name="notificationoutbox",
+            name="digest_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="Pending rows sharing this key are delivered as one message.",
+                max_length=150,
+                verbose_name="Digest Key",
+            ),
+        ),
+    ]
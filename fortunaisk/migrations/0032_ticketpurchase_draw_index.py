@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-17 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("fortunaisk", "0031_notificationoutbox_digest"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ticketpurchase",
+            index=models.Index(
+                fields=["lottery", "status", "id"], name="fortunaisk_purchase_draw_idx"
+            ),
+        ),
+    ]
@@ -3,8 +3,9 @@
 from .autolottery import AutoLottery
 from .general import General
 from .lottery import Lottery
-from .payment import ProcessedPayment
-from .ticket import TicketAnomaly, TicketPurchase, Winner
+from .notification import NotificationOutbox
+from .payment import PaymentWatermark, ProcessedPayment
+from .ticket import TicketAnomaly, TicketCounter, TicketPurchase, Winner
 from .webhook import WebhookConfiguration
 from .winner_distribution import WinnerDistribution
 
@@ -12,10 +13,13 @@ __all__ = [
     "Lottery",
     "AutoLottery",
     "TicketPurchase",
+    "TicketCounter",
     "Winner",
     "TicketAnomaly",
     "WebhookConfiguration",
     "ProcessedPayment",
+    "PaymentWatermark",
     "General",
     "WinnerDistribution",
+    "NotificationOutbox",
 ]
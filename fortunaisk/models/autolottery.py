@@ -30,6 +30,10 @@ class AutoLottery(models.Model):
         ("days", "Days"),
         ("months", "Months"),
     ]
+    DRAW_MODES = [
+        ("replacement", "Independent draws (a ticket can win several prizes)"),
+        ("distinct", "Distinct winners (each ticket purchase wins at most once)"),
+    ]
 
     is_active = models.BooleanField(default=True, verbose_name="Is Active")
     name = models.CharField(
@@ -60,6 +64,13 @@ class AutoLottery(models.Model):
     winner_count = models.PositiveIntegerField(
         default=1, verbose_name="Number of Winners"
     )
+    draw_mode = models.CharField(
+        max_length=20,
+        choices=DRAW_MODES,
+        default="replacement",
+        verbose_name="Draw Mode",
+        help_text="Whether the same ticket purchase may win more than one prize.",
+    )
     winners_distribution = models.JSONField(
         default=list,
         blank=True,
@@ -158,6 +169,7 @@ class AutoLottery(models.Model):
             end_date=timezone.now() + self.get_duration_timedelta(),
             payment_receiver=self.payment_receiver,
             winner_count=self.winner_count,
+            draw_mode=self.draw_mode,
             max_tickets_per_user=self.max_tickets_per_user,
             lottery_reference=Lottery.generate_unique_reference(),
             duration_value=self.duration_value,
@@ -9,17 +9,23 @@ from decimal import ROUND_HALF_UP, Decimal
 
 # Django
 from django.db import models
-from django.db.models import Sum
-from django.db.models.functions import Coalesce
+from django.db.models import DecimalField, F, Q, Sum, Value, Window
+from django.db.models.functions import Coalesce, Round
 from django.utils import timezone
 
 # Alliance Auth
 from allianceauth.eveonline.models import EveCorporationInfo
 
+# fortunaisk
+from fortunaisk import app_settings
+from fortunaisk.draw import weighted_choices_stream, weighted_sample_stream
+from fortunaisk.models.tracking import TrackedFieldsMixin
+from fortunaisk.references import normalize_reference
+
 logger = logging.getLogger(__name__)
 
 
-class Lottery(models.Model):
+class Lottery(TrackedFieldsMixin, models.Model):
     DURATION_UNITS = [
         ("hours", "Hours"),
         ("days", "Days"),
@@ -31,6 +37,10 @@ class Lottery(models.Model):
         ("completed", "Completed"),
         ("cancelled", "Cancelled"),
     ]
+    DRAW_MODES = [
+        ("replacement", "Independent draws (a ticket can win several prizes)"),
+        ("distinct", "Distinct winners (each ticket purchase wins at most once)"),
+    ]
 
     ticket_price = models.DecimalField(
         max_digits=20,
@@ -56,6 +66,15 @@ class Lottery(models.Model):
         db_index=True,
         verbose_name="Lottery Reference",
     )
+    normalized_reference = models.CharField(
+        max_length=20,
+        unique=True,
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name="Normalized Reference",
+        help_text="Trimmed, upper-cased reference used to match wallet payments.",
+    )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -105,6 +124,16 @@ class Lottery(models.Model):
     winner_count = models.PositiveIntegerField(
         default=1, verbose_name="Number of Winners"
     )
+    draw_mode = models.CharField(
+        max_length=20,
+        choices=DRAW_MODES,
+        default="replacement",
+        verbose_name="Draw Mode",
+        help_text="Whether the same ticket purchase may win more than one prize.",
+    )
+
+    # Stored values diffed by the save signals (see TrackedFieldsMixin)
+    tracked_fields = ("status", "end_date")
 
     class Meta:
         default_permissions = ()
@@ -125,6 +154,7 @@ class Lottery(models.Model):
         self.clean()
         if not self.lottery_reference:
             self.lottery_reference = self.generate_unique_reference()
+        self.normalized_reference = normalize_reference(self.lottery_reference)
         self.end_date = self.start_date + self.get_duration_timedelta()
         super().save(*args, **kwargs)
 
@@ -137,23 +167,45 @@ class Lottery(models.Model):
             return timedelta(days=30 * self.duration_value)
         return timedelta(hours=self.duration_value)
 
+    def compute_pot(self, gross):
+        """Returns (tax_amount, total_pot) for a gross pot."""
+        tax_amt = (gross * self.tax / Decimal("100")).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+        net = (gross - tax_amt).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return tax_amt, net
+
     def update_total_pot(self):
-        """Recalculates tax_amount and total_pot."""
+        """Recalculates tax_amount and total_pot from all ticket purchases."""
         # fortunaisk
         from fortunaisk.models.ticket import TicketPurchase
 
         gross = TicketPurchase.objects.filter(lottery=self).aggregate(
             total=Coalesce(Sum("amount"), Decimal("0.00"))
         )["total"]
-        tax_amt = (gross * self.tax / Decimal("100")).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
-        net = (gross - tax_amt).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-        self.tax_amount = tax_amt
-        self.total_pot = net
+        self.tax_amount, self.total_pot = self.compute_pot(gross)
         self.save(update_fields=["tax_amount", "total_pot"])
 
+    def add_to_pot(self, amount):
+        """
+        Adds `amount` ISK (gross) to the pot in a single UPDATE.
+
+        The gross pot is total_pot + tax_amount, so tax and net are derived
+        from the current row with F() expressions: constant time, atomic and
+        without firing the Lottery save signals.
+        """
+        money = DecimalField(max_digits=25, decimal_places=2)
+        gross = F("total_pot") + F("tax_amount") + Value(amount, output_field=money)
+        tax_amt = Round(
+            gross * F("tax") / Value(Decimal("100"), output_field=money),
+            2,
+            output_field=money,
+        )
+        Lottery.objects.filter(pk=self.pk).update(
+            tax_amount=tax_amt, total_pot=gross - tax_amt
+        )
+        self.refresh_from_db(fields=["tax_amount", "total_pot"])
+
     def complete_lottery(self):
         """Starts finalization if active."""
         if self.status != "active":
@@ -176,19 +228,105 @@ class Lottery(models.Model):
         logger.info(f"Scheduled finalize_lottery for {self.lottery_reference}.")
 
     def select_winners(self):
-        """Selects `winner_count` TicketPurchase randomly, weighted by `quantity`."""
+        """
+        Selects `winner_count` TicketPurchase randomly, weighted by `quantity`.
+
+        Draws are independent (with replacement), like `random.choices`,
+        unless `draw_mode` is "distinct": then each purchase wins at most once
+        and fewer than `winner_count` winners are returned when there are not
+        enough purchases. Purchases are streamed as `(id, quantity)` tuples
+        through a one-pass weighted reservoir, and only the winning rows are
+        loaded afterwards.
+        """
         # fortunaisk
         from fortunaisk.models.ticket import TicketPurchase
 
-        purchases = list(
-            TicketPurchase.objects.filter(lottery=self, status="processed")
+        purchases = TicketPurchase.objects.filter(lottery=self, status="processed")
+        sampler = (
+            weighted_sample_stream
+            if self.draw_mode == "distinct"
+            else weighted_choices_stream
         )
-        if not purchases:
+        picks = sampler(
+            purchases.order_by()
+            .values_list("id", "quantity")
+            .iterator(chunk_size=2000),
+            self.winner_count,
+        )
+        if not picks:
             logger.info(f"No tickets for {self.lottery_reference}.")
             return []
 
-        weights = [p.quantity for p in purchases]
-        return random.choices(purchases, weights=weights, k=self.winner_count)
+        by_id = purchases.in_bulk(set(picks))
+        return [by_id[pk] for pk in picks]
+
+    def select_winners_by_ticket(self):
+        """
+        Database draw: picks `winner_count` random ticket numbers and resolves
+        each to the purchase holding it.
+
+        Processed purchases, ordered by id, own consecutive ticket ranges
+        `[offset, offset + quantity)`, where the offsets come from a
+        `SUM(quantity) OVER (ORDER BY id)` window. Ticket numbers are drawn
+        uniformly (with replacement) in `[0, total_tickets)`, so the odds are
+        the same as `select_winners`.
+
+        The offsets are computed on the fly rather than stored: purchases are
+        merged per character and keep growing until sales close, so stored
+        ranges would have to be rewritten for every later purchase on each
+        ticket bought. A lottery is drawn once, and the window is a single
+        scan of its purchases along the (lottery, status, id) index for all
+        winners at once.
+
+        Returns:
+            list: (TicketPurchase, ticket_number) pairs in draw order
+        """
+        # fortunaisk
+        from fortunaisk.models.ticket import TicketPurchase
+
+        purchases = TicketPurchase.objects.filter(lottery=self, status="processed")
+        total = purchases.aggregate(total=Coalesce(Sum("quantity"), 0))["total"]
+        if not total:
+            logger.info(f"No tickets for {self.lottery_reference}.")
+            return []
+        tickets = [random.randrange(total) for _ in range(self.winner_count)]
+
+        covering = Q()
+        for ticket in set(tickets):
+            covering |= Q(ticket_start__lte=ticket, ticket_end__gt=ticket)
+        ranges = list(
+            purchases.annotate(
+                ticket_end=Window(Sum("quantity"), order_by=F("id").asc())
+            )
+            .annotate(ticket_start=F("ticket_end") - F("quantity"))
+            .filter(covering)
+            .values_list("id", "ticket_start", "ticket_end")
+        )
+        by_id = purchases.in_bulk({pk for pk, _, _ in ranges})
+
+        winners = []
+        for ticket in tickets:
+            pk = next(pk for pk, start, end in ranges if start <= ticket < end)
+            winners.append((by_id[pk], ticket))
+        return winners
+
+    def draw_winners(self):
+        """
+        Draws winners with the configured `FORTUNAISK_DRAW_BACKEND`.
+
+        Distinct-winner lotteries always use the streaming sampler, as ticket
+        numbers drawn independently could land on the same purchase twice.
+
+        Returns:
+            list: (TicketPurchase, ticket_number) pairs; ticket_number is None
+                for the streaming backend
+        """
+        if (
+            app_settings.FORTUNAISK_DRAW_BACKEND == "database"
+            and self.draw_mode != "distinct"
+        ):
+            return self.select_winners_by_ticket()
+        return [(purchase, None) for purchase in self.select_winners()]
 
     @property
     def winners(self):
@@ -0,0 +1,79 @@
+# fortunaisk/models/notification.py
+
+# Django
+from django.db import models
+from django.utils import timezone
+
+
+class NotificationOutbox(models.Model):
+    """
+    A notification waiting to be delivered.
+
+    Rows are written by `notify_discord_or_fallback` in the caller's
+    transaction and delivered after commit by `drain_notification_outbox`,
+    so no HTTP request runs on the write path and rolled back changes never
+    announce anything. Delivered rows are deleted; rows that keep failing
+    end up "failed".
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("failed", "Failed"),
+    ]
+
+    event = models.CharField(
+        max_length=50,
+        blank=True,
+        default="",
+        verbose_name="Event",
+        help_text="Webhook event key, empty for private notifications.",
+    )
+    title = models.CharField(max_length=255, blank=True, default="")
+    message = models.TextField(blank=True, default="")
+    embed = models.JSONField(null=True, blank=True)
+    level = models.CharField(max_length=10, default="info")
+    private = models.BooleanField(default=False)
+    recipient_ids = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="Recipients",
+        help_text="Ids of the users to DM (private or fallback notifications).",
+    )
+    webhook_ids = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name="Pending Webhooks",
+        help_text=(
+            "Webhook configurations still to deliver to after a rate limit; "
+            "empty means every subscribed webhook."
+        ),
+    )
+    digest_key = models.CharField(
+        max_length=150,
+        blank=True,
+        default="",
+        db_index=True,
+        verbose_name="Digest Key",
+        help_text="Pending rows sharing this key are delivered as one message.",
+    )
+    digest = models.JSONField(
+        null=True,
+        blank=True,
+        verbose_name="Digest Data",
+        help_text="Title, intro, line and totals used to merge digest rows.",
+    )
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default="pending", db_index=True
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        default_permissions = ()
+        verbose_name = "Notification Outbox Entry"
+        verbose_name_plural = "Notification Outbox"
+
+    def __str__(self):
+        return f"Notification {self.event or 'private'}: {self.title} [{self.status}]"
@@ -1,6 +1,7 @@
 # fortunaisk/models/payment.py
 
 # Standard Library
+import uuid
 from decimal import Decimal
 
 # Django
@@ -8,7 +9,7 @@ from django.contrib.auth import get_user_model
 from django.db import models
 
 # Alliance Auth
-from allianceauth.eveonline.models import EveCharacter
+from allianceauth.eveonline.models import EveCharacter, EveCorporationInfo
 
 
 class ProcessedPayment(models.Model):
@@ -52,9 +53,72 @@ class ProcessedPayment(models.Model):
         verbose_name="Processed At",
         help_text="Timestamp when the payment was processed.",
     )
+    claim_token = models.UUIDField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        verbose_name="Claim Token",
+        help_text="Token of the processing run that claimed this payment.",
+    )
 
     class Meta:
         default_permissions = ()
 
     def __str__(self):
         return f"ProcessedPayment(payment_id={self.payment_id})"
+
+    @classmethod
+    def claim(cls, rows) -> set:
+        """
+        Claim payments with a single insert-or-ignore on `payment_id`.
+
+        Rows whose payment_id already exists (processed earlier, or claimed by
+        a concurrent transaction) are skipped by the database. The rows that
+        were actually inserted are found back through a per-call token.
+
+        Args:
+            rows: Unsaved ProcessedPayment instances
+
+        Returns:
+            set: payment_ids (as strings) won by this call
+        """
+        token = uuid.uuid4()
+        for row in rows:
+            row.claim_token = token
+        cls.objects.bulk_create(rows, ignore_conflicts=True, batch_size=500)
+        return set(
+            cls.objects.filter(claim_token=token).values_list("payment_id", flat=True)
+        )
+
+
+class PaymentWatermark(models.Model):
+    """
+    High-water mark of the corporation wallet journal already scanned
+    for lottery payments, per receiving corporation.
+    """
+
+    corporation = models.OneToOneField(
+        EveCorporationInfo,
+        on_delete=models.CASCADE,
+        related_name="fortunaisk_payment_watermark",
+        verbose_name="Receiving Corporation",
+    )
+    last_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Last Journal Date",
+        help_text="Date of the last journal entry scanned.",
+    )
+    last_entry_id = models.BigIntegerField(
+        default=0,
+        verbose_name="Last Journal Entry ID",
+        help_text="Entry ID of the last journal entry scanned.",
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated At")
+
+    class Meta:
+        default_permissions = ()
+
+    def __str__(self):
+        return f"PaymentWatermark(corporation={self.corporation_id}, last_entry_id={self.last_entry_id})"
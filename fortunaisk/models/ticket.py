@@ -5,15 +5,18 @@ from decimal import Decimal
 
 # Django
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 
 # Alliance Auth
 from allianceauth.eveonline.models import EveCharacter
 
+# fortunaisk
+from fortunaisk.models.tracking import TrackedFieldsMixin
+
 User = get_user_model()
 
 
-class TicketPurchase(models.Model):
+class TicketPurchase(TrackedFieldsMixin, models.Model):
     STATUS_CHOICES = [
         ("pending", "Pending"),
         ("processed", "Processed"),
@@ -68,8 +71,17 @@ class TicketPurchase(models.Model):
         verbose_name="Ticket Status",
     )
 
+    # Stored values diffed by the save signals (see TrackedFieldsMixin)
+    tracked_fields = ("quantity", "amount")
+
     class Meta:
         default_permissions = ()
+        indexes = [
+            # Draws read a lottery's processed purchases in id order
+            models.Index(
+                fields=["lottery", "status", "id"], name="fortunaisk_purchase_draw_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return (
@@ -78,7 +90,83 @@ class TicketPurchase(models.Model):
         )
 
 
-class Winner(models.Model):
+class TicketCounter(models.Model):
+    """
+    Denormalized number of processed tickets a user holds in a lottery.
+
+    Maintained by the payment engine alongside every TicketPurchase change so
+    ticket limits and per-user counts are a single-row lookup. Can be rebuilt
+    from the purchases at any time (`rebuild_fortuna_ticket_counters`).
+    """
+
+    lottery = models.ForeignKey(
+        "fortunaisk.Lottery",
+        on_delete=models.CASCADE,
+        related_name="ticket_counters",
+        verbose_name="Lottery",
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="ticket_counters",
+        verbose_name="Django User",
+    )
+    quantity = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Ticket Quantity",
+        help_text="Processed tickets held by the user across all characters.",
+    )
+
+    class Meta:
+        default_permissions = ()
+        constraints = [
+            models.UniqueConstraint(
+                fields=["lottery", "user"], name="unique_ticketcounter_lottery_user"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"TicketCounter(lottery={self.lottery_id}, user={self.user_id}, "
+            f"quantity={self.quantity})"
+        )
+
+    @classmethod
+    def rebuild(cls, lottery_ids=None) -> int:
+        """
+        Recompute counters from processed ticket purchases.
+
+        Args:
+            lottery_ids: Restrict the rebuild to these lotteries (all if None)
+
+        Returns:
+            int: Number of counters written
+        """
+        purchases = TicketPurchase.objects.filter(status="processed")
+        counters = cls.objects.all()
+        if lottery_ids is not None:
+            purchases = purchases.filter(lottery_id__in=lottery_ids)
+            counters = counters.filter(lottery_id__in=lottery_ids)
+        totals = (
+            purchases.values("lottery_id", "user_id")
+            .annotate(total=models.Sum("quantity"))
+            .filter(total__gt=0)
+        )
+        with transaction.atomic():
+            rows = [
+                cls(
+                    lottery_id=row["lottery_id"],
+                    user_id=row["user_id"],
+                    quantity=row["total"],
+                )
+                for row in totals
+            ]
+            counters.delete()
+            cls.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+
+class Winner(TrackedFieldsMixin, models.Model):
     ticket = models.ForeignKey(
         TicketPurchase,
         on_delete=models.CASCADE,
@@ -101,6 +189,12 @@ class Winner(models.Model):
         help_text="ISK amount that the winner receives.",
     )
     won_at = models.DateTimeField(auto_now_add=True, verbose_name="Winning Date")
+    ticket_number = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="Ticket Number",
+        help_text="Drawn ticket number (0-based, purchases ordered by id), if known.",
+    )
     distributed = models.BooleanField(
         default=False,
         verbose_name="Prize Distributed",
@@ -122,6 +216,9 @@ class Winner(models.Model):
         help_text="User who distributed the prize.",
     )
 
+    # Stored values diffed by the save signals (see TrackedFieldsMixin)
+    tracked_fields = ("distributed",)
+
     class Meta:
         default_permissions = ()
 
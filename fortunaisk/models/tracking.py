@@ -0,0 +1,80 @@
+# fortunaisk/models/tracking.py
+
+
+class TrackedFieldsMixin:
+    """
+    Remembers the database values of a model's `tracked_fields`.
+
+    The values are captured when the instance is loaded (`from_db`) and
+    again after every `save()` or `refresh_from_db()`, so signal handlers
+    can diff an instance against its stored row without re-fetching it.
+    The snapshot is the row as this instance last read or wrote it, not a
+    locked read: load the instance with `select_for_update()` when a
+    concurrent writer could change a tracked field in between.
+
+    A tracked field that was deferred when loading is fetched on first use.
+    """
+
+    tracked_fields: tuple = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot_tracked_fields(kwargs.get("update_fields"))
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot_tracked_fields(fields)
+
+    def _snapshot_tracked_fields(self, fields=None):
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        for name in self.tracked_fields:
+            if fields is not None and name not in fields:
+                continue
+            attname = self._meta.get_field(name).attname
+            if attname in self.__dict__:
+                loaded[name] = self.__dict__[attname]
+            else:
+                loaded.pop(name, None)
+
+    def loaded_value(self, name, default=None):
+        """
+        Returns the stored value of a tracked field.
+
+        Args:
+            name: Name of a field listed in `tracked_fields`
+            default: Value returned for an instance that has no stored row
+
+        Returns:
+            The field's value as last loaded from or saved to the database
+        """
+        loaded = self.__dict__.get("_loaded_values")
+        if loaded is None:
+            # Built in memory and never saved: no stored row
+            return default
+        if name not in loaded:
+            # Deferred when loaded: read the stored value once
+            loaded[name] = (
+                type(self)
+                ._base_manager.filter(pk=self.pk)
+                .values_list(name, flat=True)
+                .first()
+            )
+        return loaded[name]
+
+    @property
+    def changed_fields(self) -> set:
+        """Tracked fields whose value differs from the stored row (all if new)."""
+        if "_loaded_values" not in self.__dict__:
+            return set(self.tracked_fields)
+        return {
+            name
+            for name in self.tracked_fields
+            if getattr(self, self._meta.get_field(name).attname)
+            != self.loaded_value(name)
+        }
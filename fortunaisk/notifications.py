@@ -2,18 +2,36 @@
 
 # Standard Library
 import logging
-from datetime import datetime
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import NamedTuple
 
 # Third Party
 import requests
+from requests.adapters import HTTPAdapter
 
 # Django
-from django.db.models import QuerySet
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, router, transaction
+from django.db.models import F, QuerySet, Window
+from django.db.models.functions import RowNumber
+from django.db.models.signals import post_save
+from django.utils import timezone
 
 # Alliance Auth
 from allianceauth.notifications import notify as alliance_notify
+from allianceauth.notifications.models import Notification
 
-from .models.webhook import WebhookConfiguration
+from . import app_settings
+from .models.notification import NotificationOutbox
+from .routing import WebhookTarget, webhook_targets
 
 logger = logging.getLogger(__name__)
 
@@ -64,45 +82,303 @@ def build_embed(
     return embed
 
 
-def _send_to_webhook(
-    cfg: WebhookConfiguration, embed: dict, content: str | None
-) -> bool:
+class WebhookResult(NamedTuple):
+    """Outcome of one webhook POST."""
+
+    name: str
+    ok: bool
+    status: int | None = None
+    error: str | None = None
+    # Seconds to wait before posting again, when Discord rate limited the POST
+    retry_after: float | None = None
+
+    @property
+    def rate_limited(self) -> bool:
+        return not self.ok and self.retry_after is not None
+
+
+# Discord limits per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS = 6000
+MAX_CONTENT_CHARS = 2000
+# Rate-limit windows up to this many seconds are waited out by the queue;
+# longer ones leave the notifications pending until the window reopens.
+MAX_INLINE_WAIT = 2.0
+
+# Shared keep-alive HTTP session and fan-out pool, created lazily per process
+_http_lock = threading.Lock()
+_http_session = None
+_http_executor = None
+
+
+def _reset_http_pool():
+    """Forget the session and pool (a forked child must not reuse them)."""
+    global _http_session, _http_executor
+    _http_session = None
+    _http_executor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_http_pool)
+
+
+def _get_http_pool() -> tuple[requests.Session, ThreadPoolExecutor]:
+    """
+    Return the process-wide HTTP session and webhook thread pool.
+
+    The session keeps connections alive per host (one pool slot per worker
+    thread), so repeated posts to Discord skip the TCP/TLS handshake.
+    """
+    global _http_session, _http_executor
+    with _http_lock:
+        if _http_session is None:
+            workers = app_settings.FORTUNAISK_WEBHOOK_WORKERS
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+            _http_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="fortunaisk-webhook"
+            )
+        return _http_session, _http_executor
+
+
+def _ratelimit_key(cfg) -> str:
+    return f"fortunaisk_webhook_ratelimit_{cfg.pk}"
+
+
+def webhook_wait(cfg: WebhookTarget) -> float:
     """
-    Send a single embed + content (with any role pings) to one webhook config.
+    Seconds before `cfg` may be posted to again (0 when it is not limited).
 
-    Attempts to post the provided embed and content to the Discord webhook URL
-    specified in the configuration. If ping roles are configured, they will be
-    mentioned in the message content.
+    The rate-limit window is kept in the shared cache, so every worker
+    honours it.
+    """
+    until = cache.get(_ratelimit_key(cfg))
+    return max(0.0, until - time.time()) if until else 0.0
+
+
+def _rate_limit_wait(resp) -> float | None:
+    """
+    Seconds to wait after a Discord response, or None when not limited.
+
+    Uses `retry_after` of a 429 body (or its Retry-After header), and
+    X-RateLimit-Reset-After once X-RateLimit-Remaining reaches 0.
+    """
+    if resp.status_code == 429:
+        try:
+            return max(0.0, float(resp.json()["retry_after"]))
+        except (ValueError, KeyError, TypeError):
+            try:
+                return max(0.0, float(resp.headers.get("Retry-After", 1)))
+            except ValueError:
+                return 1.0
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(0.0, float(resp.headers.get("X-RateLimit-Reset-After", 0)))
+        except ValueError:
+            return None
+    return None
+
+
+def _post_webhook(cfg: WebhookTarget, payload: dict) -> WebhookResult:
+    """
+    POST one message to a webhook, honouring its rate-limit window.
+
+    Short waits are slept through; a longer open window returns a rate
+    limited result without sending.
 
     Args:
-        cfg (WebhookConfiguration): The webhook configuration to use
-        embed (dict): The Discord embed object to send
-        content (Optional[str]): Additional text content to include with the embed
+        cfg (WebhookTarget): The webhook to post to
+        payload (dict): Discord message payload
 
     Returns:
-        bool: True if the webhook POST was successful, False otherwise
+        WebhookResult: Whether the POST succeeded, with its status or error
     """
-    url = cfg.webhook_url
-    mention = ""
-    if cfg.ping_roles:
-        mention = " ".join(f"<@&{role_id}>" for role_id in cfg.ping_roles)
-
-    payload = {}
-    if mention or content:
-        payload["content"] = f"{mention} {content or ''}".strip()
-    if embed:
-        payload["embeds"] = [embed]
+    wait = webhook_wait(cfg)
+    if wait > MAX_INLINE_WAIT:
+        return WebhookResult(cfg.name, False, 429, "Rate limited", wait)
+    if wait:
+        time.sleep(wait)
 
+    session, _ = _get_http_pool()
     try:
-        resp = requests.post(url, json=payload, timeout=5)
+        resp = session.post(
+            cfg.webhook_url,
+            json=payload,
+            timeout=app_settings.FORTUNAISK_WEBHOOK_TIMEOUT,
+        )
+        wait = _rate_limit_wait(resp)
+        if wait:
+            cache.set(_ratelimit_key(cfg), time.time() + wait, math.ceil(wait) + 1)
+        if resp.status_code == 429:
+            logger.warning(
+                "Webhook rate limited (cfg=%s, retry in %ss)", cfg.name, wait
+            )
+            return WebhookResult(cfg.name, False, 429, "Rate limited", wait or 0.0)
         resp.raise_for_status()
         logger.info(
-            "Webhook POST succeeded (cfg=%s, status=%s)", cfg.name, resp.status_code
+            "Webhook POST succeeded (cfg=%s, status=%s, embeds=%s)",
+            cfg.name,
+            resp.status_code,
+            len(payload.get("embeds", [])),
         )
-        return True
+        return WebhookResult(cfg.name, True, resp.status_code)
     except Exception as exc:
         logger.error("Webhook POST failed (cfg=%s): %s", cfg.name, exc, exc_info=True)
-        return False
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        return WebhookResult(cfg.name, False, status, str(exc))
+
+
+def _embed_chars(embed: dict) -> int:
+    """Characters of an embed counted by Discord's per-message embed limit."""
+    fields = embed.get("fields") or []
+    return (
+        len(embed.get("title") or "")
+        + len(embed.get("description") or "")
+        + len((embed.get("footer") or {}).get("text") or "")
+        + len((embed.get("author") or {}).get("name") or "")
+        + sum(len(f.get("name") or "") + len(f.get("value") or "") for f in fields)
+    )
+
+
+def _message_payload(mention: str, embeds: list, contents: list) -> dict:
+    payload = {}
+    content = " ".join(part for part in (mention, "\n".join(contents)) if part)
+    if content:
+        payload["content"] = content
+    if embeds:
+        payload["embeds"] = embeds
+    return payload
+
+
+def pack_messages(cfg: WebhookTarget, entries) -> list:
+    """
+    Pack outbox entries for one webhook into as few messages as possible.
+
+    Consecutive entries share a message while it stays within Discord's
+    limits (10 embeds, 6000 embed characters, 2000 content characters).
+    Role pings are added once per message.
+
+    Args:
+        cfg (WebhookTarget): The webhook the messages are for
+        entries: NotificationOutbox rows, in delivery order
+
+    Returns:
+        list: (entries, payload) per message
+    """
+    mention = " ".join(f"<@&{role_id}>" for role_id in cfg.ping_roles or [])
+    messages = []
+    batch, embeds, contents, chars = [], [], [], 0
+    for entry in entries:
+        embed_chars = _embed_chars(entry.embed) if entry.embed else 0
+        content_chars = len(mention) + sum(len(c) + 1 for c in contents)
+        if batch and (
+            len(embeds) + bool(entry.embed) > MAX_EMBEDS_PER_MESSAGE
+            or chars + embed_chars > MAX_EMBED_CHARS
+            or content_chars + len(entry.message) > MAX_CONTENT_CHARS
+        ):
+            messages.append((batch, _message_payload(mention, embeds, contents)))
+            batch, embeds, contents, chars = [], [], [], 0
+        batch.append(entry)
+        if entry.embed:
+            embeds.append(entry.embed)
+            chars += embed_chars
+        if entry.message:
+            contents.append(entry.message)
+    if batch:
+        messages.append((batch, _message_payload(mention, embeds, contents)))
+    return messages
+
+
+def _send_queue(cfg: WebhookTarget, entries) -> dict:
+    """
+    Send one webhook's queue of entries in packed messages, in order.
+
+    A message hitting a short rate-limit window is retried once after it;
+    on a longer window the rest of the queue is left for later.
+
+    Returns:
+        dict: {entry pk: WebhookResult}
+    """
+    results = {}
+    messages = pack_messages(cfg, entries)
+    for index, (batch, payload) in enumerate(messages):
+        result = _post_webhook(cfg, payload)
+        if result.rate_limited and result.retry_after <= MAX_INLINE_WAIT:
+            result = _post_webhook(cfg, payload)
+        results.update((entry.pk, result) for entry in batch)
+        if result.rate_limited:
+            for later, _ in messages[index + 1 :]:
+                results.update((entry.pk, result) for entry in later)
+            break
+    return results
+
+
+def dispatch_webhook_queues(queues: dict) -> dict:
+    """
+    Send per-webhook queues, one queue per thread of the shared pool.
+
+    Each webhook's messages go out sequentially (they share its rate limit),
+    while different webhooks are served concurrently.
+
+    Args:
+        queues: {WebhookTarget: [NotificationOutbox, ...]}
+
+    Returns:
+        dict: {(entry pk, config pk): WebhookResult}
+    """
+    if len(queues) <= 1:
+        sent = [(cfg, _send_queue(cfg, entries)) for cfg, entries in queues.items()]
+    else:
+        _, executor = _get_http_pool()
+        futures = [
+            (cfg, executor.submit(_send_queue, cfg, entries))
+            for cfg, entries in queues.items()
+        ]
+        sent = [(cfg, future.result()) for cfg, future in futures]
+    return {
+        (entry_pk, cfg.pk): result
+        for cfg, results in sent
+        for entry_pk, result in results.items()
+    }
+
+
+# Set while a drain task is queued; the drain clears it before reading rows
+OUTBOX_DRAIN_KEY = "fortunaisk_outbox_drain_queued"
+
+
+def _recipient_list(users) -> list:
+    """Normalize a user, list of users or QuerySet of users to a list."""
+    if isinstance(users, QuerySet):
+        return list(users)
+    if isinstance(users, (list, tuple)):
+        return list(users)
+    return [users] if users else []
+
+
+def schedule_outbox_drain():
+    """
+    Queue a `drain_notification_outbox` task unless one is already queued.
+
+    Meant for `transaction.on_commit`: a transaction sending several
+    notifications triggers a single drain.
+    """
+    if cache.add(OUTBOX_DRAIN_KEY, True, timeout=60):
+        # fortunaisk
+        from fortunaisk.tasks import drain_notification_outbox
+
+        drain_notification_outbox.delay()
+
+
+def schedule_digest_drain(window: int):
+    """Queue a drain for when the digest window of new rows ends."""
+    if cache.add(f"{OUTBOX_DRAIN_KEY}_digest", True, timeout=window):
+        # fortunaisk
+        from fortunaisk.tasks import drain_notification_outbox
+
+        drain_notification_outbox.apply_async(countdown=window)
 
 
 def notify_discord_or_fallback(
@@ -114,17 +390,20 @@ def notify_discord_or_fallback(
     level: str = "info",
     private: bool = False,
     event: str | None = None,
+    digest_key: str | None = None,
+    digest: dict | None = None,
 ):
     """
-    Send notifications via Discord webhooks or Alliance Auth notifications.
+    Queue a notification for Discord webhooks or Alliance Auth notifications.
 
-    This function implements a multi-tiered notification strategy:
+    The notification is written to the outbox in the caller's transaction and
+    delivered by `drain_notification_outbox` once that transaction commits
+    (see `deliver_notifications` for the delivery rules). Nothing is sent if
+    the transaction rolls back, and no HTTP request runs while it holds locks.
 
-    1. If `private=True`: Send direct messages to each user via Alliance Auth.
-    2. If `event` is provided: Send to all webhook configurations that have
-    subscribed to that event type, including any configured role pings.
-    3. If no webhooks succeeded or weren't attempted: Fall back to sending
-    individual Alliance Auth notifications to each specified user.
+    With `FORTUNAISK_DIGEST_WINDOW` set, a notification given a `digest_key`
+    waits that many seconds, and all pending notifications sharing the key
+    are then delivered as one message (see `merge_digests`).
 
     Args:
         users: A user, list of users, or QuerySet of users to notify
@@ -134,56 +413,281 @@ def notify_discord_or_fallback(
         level: Notification level ('info', 'success', 'warning', 'error')
         private: Whether to only send private notifications
         event: Event type identifier for webhook filtering
+        digest_key: Key of the digest (user/channel) this notification joins
+        digest: Digest data: "title" and "intro" of the combined message, this
+            notification's "line" and its summable "totals" ({label: number})
+
+    Returns:
+        NotificationOutbox: The queued outbox row
     """
     # Build embed if needed
     if embed is None and title:
         embed = build_embed(title=title, description=message, level=level)
         message = None
 
-    # Normalize user list
-    if isinstance(users, QuerySet):
-        recipient_list = list(users)
-    elif isinstance(users, (list, tuple)):
-        recipient_list = users
+    window = app_settings.FORTUNAISK_DIGEST_WINDOW if digest_key else 0
+    entry = NotificationOutbox.objects.create(
+        event=event or "",
+        title=title or "",
+        message=message or "",
+        embed=embed,
+        level=level,
+        private=private,
+        recipient_ids=[u.pk for u in _recipient_list(users)],
+        digest_key=digest_key if window else "",
+        digest=digest if window else None,
+        next_attempt_at=timezone.now() + timedelta(seconds=window),
+    )
+    if window:
+        transaction.on_commit(lambda: schedule_digest_drain(window))
     else:
-        recipient_list = [users] if users else []
-
-    # Private path: DM all
-    if private:
-        text = message or (embed.get("description") if embed else "")
-        for u in recipient_list:
-            alliance_notify(
-                user=u, title=title or embed.get("title", ""), message=text, level=level
+        transaction.on_commit(schedule_outbox_drain)
+    return entry
+
+
+# Discord's limit on an embed description
+MAX_DESCRIPTION_CHARS = 4096
+
+
+def _digest_embed(entries) -> dict:
+    """Combined embed of several digest entries: one line each, plus totals."""
+    digests = [entry.digest or {} for entry in entries]
+    totals = {}
+    for digest in digests:
+        for label, value in (digest.get("totals") or {}).items():
+            totals[label] = totals.get(label, Decimal("0")) + Decimal(str(value))
+
+    # Totals close the description so that DMs (which drop fields) show them
+    head = [digests[0]["intro"], ""] if digests[0].get("intro") else []
+    tail = ["", " · ".join(f"**{k}:** {v:,}" for k, v in totals.items())]
+    lines = [f"• {digest.get('line', '')}" for digest in digests]
+    budget = MAX_DESCRIPTION_CHARS - len("\n".join(head + tail)) - 40
+    kept = []
+    for line in reversed(lines):
+        budget -= len(line) + 1
+        if budget < 0:
+            # Keep the most recent lines that fit
+            kept.insert(0, f"… {len(lines) - len(kept)} earlier notification(s)")
+            break
+        kept.insert(0, line)
+
+    return build_embed(
+        title=f"{digests[0].get('title', '')} ({len(entries)})",
+        description="\n".join(head + kept + (tail if totals else [])),
+        level=entries[0].level,
+    )
+
+
+def merge_digests(entries) -> list:
+    """
+    Group outbox entries by digest key, in id order.
+
+    Every group of two or more entries is merged into its first entry, whose
+    embed (in memory only) becomes the combined digest message. Entries
+    without a digest key form groups of one.
+
+    Args:
+        entries: NotificationOutbox rows
+
+    Returns:
+        list: (entry to deliver, [entries it stands for]) per group
+    """
+    groups = {}
+    for entry in sorted(entries, key=lambda e: e.pk):
+        groups.setdefault(entry.digest_key or ("", entry.pk), []).append(entry)
+
+    merged = []
+    for members in groups.values():
+        carrier = members[0]
+        if len(members) > 1:
+            carrier.embed = _digest_embed(members)
+            carrier.title = carrier.message = ""
+        merged.append((carrier, members))
+    return merged
+
+
+class Delivery(NamedTuple):
+    """Outcome of one outbox entry."""
+
+    done: bool
+    # Set when rate-limited webhooks still have to receive the entry
+    retry_at: datetime | None = None
+    error: str = ""
+
+
+def bulk_notify(users, title: str, message: str | None = None, level: str = "info"):
+    """
+    Send the same Alliance Auth notification to many users in one INSERT.
+
+    Mirrors `Notification.objects.notify_user` for a whole recipient list:
+    the oldest notifications of users at `NOTIFICATIONS_MAX_PER_USER` are
+    pruned, the rows are written with a single `bulk_create`, and the unread
+    count cache of every recipient is invalidated. `post_save` is replayed
+    for each row so receivers such as aa-discordnotify still forward them.
+    Databases that do not return primary keys from bulk inserts (MySQL,
+    MariaDB) get one INSERT per row instead, so receivers see saved rows.
+
+    Args:
+        users: Users to notify
+        title (str): The notification title
+        message (Optional[str]): The notification message (defaults to title)
+        level (str): Notification level ('info', 'success', 'warning', 'danger')
+
+    Returns:
+        list[Notification]: The created notifications
+    """
+    users = list({u.pk: u for u in users}.values())
+    if not users:
+        return []
+    if level not in Notification.Level:
+        level = Notification.Level.INFO
+
+    # Make room: keep at most max - 1 older notifications per recipient
+    try:
+        max_notifications = int(
+            getattr(
+                settings,
+                "NOTIFICATIONS_MAX_PER_USER",
+                Notification.NOTIFICATIONS_MAX_PER_USER_DEFAULT,
             )
-            logger.info("Queued private DM for %s: %s", u, title or text)
-        return
-
-    # Public path: by event
-    public_sent = False
-    if event:
-        # grab only configs that subscribed to this event
-        for cfg in WebhookConfiguration.objects.all():
-            if event in (cfg.notification_config or []):
-                if _send_to_webhook(cfg, embed, message):
-                    public_sent = True
-
-    # If any public webhook succeeded, stop here
-    if public_sent:
-        return
-
-    # Fallback per-user DM
-    fallback_text = message or (embed.get("description") if embed else "")
-    for u in recipient_list:
-        try:
-            alliance_notify(
-                user=u,
-                title=title or embed.get("title", ""),
-                message=fallback_text,
-                level=level,
+        )
+    except (TypeError, ValueError):
+        max_notifications = -1
+    if max_notifications < 0:
+        max_notifications = Notification.NOTIFICATIONS_MAX_PER_USER_DEFAULT
+    stale = list(
+        Notification.objects.filter(user__in=users)
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=F("user_id"),
+                order_by=F("timestamp").desc(),
+            )
+        )
+        .filter(rank__gte=max_notifications)
+        .values_list("pk", flat=True)
+    )
+    if stale:
+        Notification.objects.filter(pk__in=stale).delete()
+
+    created = [
+        Notification(user=u, title=title, message=message or title, level=level)
+        for u in users
+    ]
+    db = router.db_for_write(Notification)
+    if connections[db].features.can_return_rows_from_bulk_insert:
+        Notification.objects.using(db).bulk_create(created)
+        for notification in created:
+            post_save.send(
+                sender=Notification,
+                instance=notification,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=db,
+            )
+    else:
+        # bulk_create leaves the primary keys unset here (MySQL/MariaDB), and
+        # post_save receivers need them: save row by row (fires post_save)
+        for notification in created:
+            notification.save(using=db)
+    for u in users:
+        Notification.objects.invalidate_user_notification_cache(u.pk)
+    logger.info("Bulk notification %r sent to %s users", title, len(created))
+    return created
+
+
+def _send_dms(entry, recipients, fallback: bool = False):
+    """DM an entry's recipients through Alliance Auth, in one bulk insert."""
+    embed = entry.embed
+    title = entry.title or (embed.get("title", "") if embed else "")
+    text = entry.message or (embed.get("description") if embed else "")
+    try:
+        bulk_notify(recipients, title=title, message=text, level=entry.level)
+    except Exception as exc:
+        if not fallback:
+            raise
+        logger.error(
+            "Fallback notify failed for %s: %s", recipients, exc, exc_info=True
+        )
+    else:
+        if recipients:
+            kind = "Fallback DM sent" if fallback else "Queued private DM"
+            logger.info("%s to %s users: %s", kind, len(recipients), title or text)
+
+
+def deliver_notifications(entries, users=None) -> dict:
+    """
+    Deliver a batch of outbox entries.
+
+    This function implements a multi-tiered notification strategy:
+
+    1. If `private=True`: Send direct messages to each user via Alliance Auth.
+    2. If `event` is provided: Queue the entry for every webhook configuration
+    subscribed to that event type. Each webhook's queue is packed into
+    multi-embed messages and sent within its rate limits.
+    3. If no webhooks succeeded or weren't attempted: Fall back to sending
+    individual Alliance Auth notifications to each specified user.
+
+    A webhook that is rate limited is not a failure: the entry stays pending
+    for that webhook (its `webhook_ids` narrows to the limited configs) until
+    the window reopens, and no fallback DM is sent.
+
+    Args:
+        entries: NotificationOutbox rows
+        users: Optional {pk: User} map holding the entries' recipients
+
+    Returns:
+        dict: {entry pk: Delivery}
+    """
+    entries = list(entries)
+    if users is None:
+        users = get_user_model().objects.in_bulk(
+            {pk for entry in entries for pk in entry.recipient_ids}
+        )
+    outcome, targets, queues = {}, {}, {}
+    for entry in entries:
+        if entry.private:
+            recipients = [users[pk] for pk in entry.recipient_ids if pk in users]
+            try:
+                _send_dms(entry, recipients)
+                outcome[entry.pk] = Delivery(True)
+            except Exception as exc:
+                logger.exception("Private notification %s failed.", entry.pk)
+                outcome[entry.pk] = Delivery(False, error=str(exc))
+            continue
+        targets[entry.pk] = [
+            target
+            for target in webhook_targets(entry.event)
+            if entry.webhook_ids is None or target.pk in entry.webhook_ids
+        ]
+        for cfg in targets[entry.pk]:
+            queues.setdefault(cfg, []).append(entry)
+
+    sent = dispatch_webhook_queues(queues)
+    now = timezone.now()
+    for entry in entries:
+        if entry.private:
+            continue
+        results = {cfg.pk: sent[(entry.pk, cfg.pk)] for cfg in targets[entry.pk]}
+        limited = {pk: r for pk, r in results.items() if r.rate_limited}
+        recipients = [users[pk] for pk in entry.recipient_ids if pk in users]
+        if limited:
+            entry.webhook_ids = sorted(limited)
+            wait = max(r.retry_after for r in limited.values())
+            outcome[entry.pk] = Delivery(
+                False, now + timedelta(seconds=wait), "Rate limited by Discord."
             )
-            logger.info("Fallback DM sent to %s: %s", u, fallback_text)
-        except Exception as exc:
-            logger.error("Fallback notify failed for %s: %s", u, exc, exc_info=True)
+        elif any(r.ok for r in results.values()):
+            outcome[entry.pk] = Delivery(True)
+        elif results and not recipients:
+            errors = "; ".join(f"{r.name}: {r.error}" for r in results.values())
+            outcome[entry.pk] = Delivery(False, error=errors)
+        else:
+            # Fallback per-user DM
+            _send_dms(entry, recipients, fallback=True)
+            outcome[entry.pk] = Delivery(True)
+    return outcome
 
 
 def notify_alliance(user, title: str, message: str, level: str = "info"):
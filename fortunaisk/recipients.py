@@ -0,0 +1,53 @@
+# fortunaisk/recipients.py
+
+# Standard Library
+from typing import NamedTuple
+
+# Django
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+
+class AdminRecipient(NamedTuple):
+    """User holding `can_admin_app`, as much as notifications need of it."""
+
+    pk: int
+    username: str
+
+
+# Shared cache key of the [(pk, username), ...] admin list
+ADMIN_RECIPIENTS_KEY = "fortunaisk_admin_recipients"
+
+# Safety net for changes no signal reports (e.g. a deleted permission)
+ADMIN_RECIPIENTS_TTL = 3600
+
+
+def admin_recipients() -> list:
+    """
+    Return the users allowed to administrate FortunaIsk.
+
+    These are the users of every group granted the `can_admin_app`
+    permission. The list is read from the database once and shared through
+    the cache until a group membership or group permission changes (see
+    `signals.recipient_signals`), so a notification costs one cache read
+    instead of a user/group/permission join.
+
+    Returns:
+        list: AdminRecipient per admin user, ordered by id
+    """
+    rows = cache.get(ADMIN_RECIPIENTS_KEY)
+    if rows is None:
+        rows = list(
+            get_user_model()
+            .objects.filter(groups__permissions__codename="can_admin_app")
+            .distinct()
+            .order_by("pk")
+            .values_list("pk", "username")
+        )
+        cache.set(ADMIN_RECIPIENTS_KEY, rows, ADMIN_RECIPIENTS_TTL)
+    return [AdminRecipient(*row) for row in rows]
+
+
+def clear_admin_recipients():
+    """Drop the cached admin list."""
+    cache.delete(ADMIN_RECIPIENTS_KEY)
@@ -0,0 +1,82 @@
+# fortunaisk/references.py
+
+# Standard Library
+import re
+from typing import NamedTuple
+
+# Django
+from django.apps import apps
+
+from .caching import TTLCache
+
+# Lottery references look like LOTTERY-0123456789
+REFERENCE_PATTERN = re.compile(r"LOTTERY-\d{10}", re.IGNORECASE)
+
+
+class LotteryRef(NamedTuple):
+    """Lightweight view of a lottery, as cached by the resolver."""
+
+    id: int
+    status: str
+    start_date: object
+    end_date: object
+
+
+# normalized reference -> LotteryRef
+_resolver_cache = TTLCache(maxsize=512, ttl=300)
+
+
+def normalize_reference(value) -> str:
+    """Trimmed, upper-cased form of a lottery reference."""
+    return (value or "").strip().upper()
+
+
+def extract_reference(reason) -> str | None:
+    """Return the first LOTTERY-XXXXXXXXXX token of a free-form reason."""
+    match = REFERENCE_PATTERN.search(reason or "")
+    return match.group(0).upper() if match else None
+
+
+def payment_reference(reason) -> str:
+    """
+    Normalized lottery reference a payment reason points at.
+
+    The LOTTERY-XXXXXXXXXX token when the reason contains one, otherwise the
+    whole normalized reason (legacy exact-match behaviour).
+    """
+    return extract_reference(reason) or normalize_reference(reason)
+
+
+def resolve_lotteries(references) -> dict:
+    """
+    Resolve normalized references to LotteryRef tuples.
+
+    Cache hits cost nothing; misses are fetched with one exact lookup on the
+    unique `normalized_reference` index. Unknown references are not cached,
+    so a freshly created lottery is found immediately.
+
+    Args:
+        references: Iterable of normalized references
+
+    Returns:
+        dict: normalized reference -> LotteryRef, for known references only
+    """
+    references = set(references)
+    found = _resolver_cache.get_many(references)
+    missing = references - found.keys()
+    if missing:
+        Lottery = apps.get_model("fortunaisk", "Lottery")
+        for row in Lottery.objects.filter(normalized_reference__in=missing).values(
+            "id", "normalized_reference", "status", "start_date", "end_date"
+        ):
+            ref = LotteryRef(
+                row["id"], row["status"], row["start_date"], row["end_date"]
+            )
+            _resolver_cache.set(row["normalized_reference"], ref)
+            found[row["normalized_reference"]] = ref
+    return found
+
+
+def invalidate_reference(reference):
+    """Forget the cached resolution of a reference."""
+    _resolver_cache.invalidate(normalize_reference(reference))
@@ -0,0 +1,86 @@
+# fortunaisk/routing.py
+
+# Standard Library
+import threading
+import uuid
+from typing import NamedTuple
+
+# Django
+from django.apps import apps
+from django.core.cache import cache
+
+
+class WebhookTarget(NamedTuple):
+    """Delivery target of a WebhookConfiguration."""
+
+    pk: int
+    name: str
+    webhook_url: str | None
+    ping_roles: tuple = ()
+
+
+# Shared cache keys: token of the current routing map, and (token, map)
+ROUTES_TOKEN_KEY = "fortunaisk_webhook_routes_token"
+ROUTES_CACHE_KEY = "fortunaisk_webhook_routes"
+
+# In-process copy of the map, valid while the shared token is unchanged
+_routes_lock = threading.Lock()
+_local_token = None
+_local_routes = None
+
+
+def _build_routes() -> dict:
+    """Read every WebhookConfiguration into an event -> targets map."""
+    WebhookConfiguration = apps.get_model("fortunaisk", "WebhookConfiguration")
+    routes = {}
+    for cfg in WebhookConfiguration.objects.order_by("pk"):
+        target = WebhookTarget(
+            cfg.pk, cfg.name, cfg.webhook_url, tuple(cfg.ping_roles or ())
+        )
+        for event in dict.fromkeys(cfg.notification_config or []):
+            routes.setdefault(event, []).append(target)
+    return {event: tuple(targets) for event, targets in routes.items()}
+
+
+def webhook_routes() -> dict:
+    """
+    Return the event -> (WebhookTarget, ...) routing map.
+
+    The map is built from the database once and shared through the cache
+    under a random token; each process keeps its own copy for as long as
+    the shared token is unchanged. A lookup in steady state therefore costs
+    one small cache read and no query.
+
+    Returns:
+        dict: event key -> tuple of subscribed WebhookTargets
+    """
+    global _local_token, _local_routes
+    token = cache.get(ROUTES_TOKEN_KEY)
+    with _routes_lock:
+        if token is not None and token == _local_token:
+            return _local_routes
+
+    shared = cache.get(ROUTES_CACHE_KEY) if token is not None else None
+    if shared is None or shared[0] != token:
+        token = uuid.uuid4().hex
+        shared = (token, _build_routes())
+        cache.set_many({ROUTES_TOKEN_KEY: token, ROUTES_CACHE_KEY: shared}, None)
+
+    with _routes_lock:
+        _local_token, _local_routes = shared
+        return _local_routes
+
+
+def webhook_targets(event: str) -> tuple:
+    """WebhookTargets subscribed to `event` (empty for no or unknown event)."""
+    if not event:
+        return ()
+    return webhook_routes().get(event, ())
+
+
+def clear_webhook_routes():
+    """Drop the routing map in this process and in the shared cache."""
+    global _local_token, _local_routes
+    cache.delete_many([ROUTES_TOKEN_KEY, ROUTES_CACHE_KEY])
+    with _routes_lock:
+        _local_token = _local_routes = None
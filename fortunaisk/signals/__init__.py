@@ -2,8 +2,11 @@
 
 from . import (
     autolottery_signals,
+    corptools_signals,
+    identity_signals,
     lottery_signals,
     notifications_signals,
+    recipient_signals,
     webhook_signals,
 )
 
@@ -12,4 +15,7 @@ __all__ = [
     "webhook_signals",
     "autolottery_signals",
     "lottery_signals",
+    "identity_signals",
+    "corptools_signals",
+    "recipient_signals",
 ]
@@ -0,0 +1,72 @@
+# fortunaisk/signals/corptools_signals.py
+
+# Standard Library
+import logging
+
+# Third Party
+from celery.signals import task_prerun, task_success
+
+# Django
+from django.core.cache import cache
+from django.utils import timezone
+
+# fortunaisk
+from fortunaisk.models import Lottery
+from fortunaisk.tasks import SETTLE_GRACE, settle_pending_lotteries
+
+logger = logging.getLogger(__name__)
+
+# corptools task that syncs a corporation's wallet divisions and journal
+CORPTOOLS_WALLET_TASK = "corptools.tasks.update_corp_wallet"
+
+# Start time of a running wallet sync, per task id
+WALLET_SYNC_KEY_PREFIX = "fortunaisk_wallet_sync_"
+WALLET_SYNC_TTL = 6 * 3600
+
+
+@task_prerun.connect
+def corptools_wallet_sync_started(sender=None, task_id=None, **kwargs):
+    """
+    Remembers when a wallet sync started: only payments made before then are
+    sure to be in the journal it fetches.
+    """
+    if getattr(sender, "name", None) != CORPTOOLS_WALLET_TASK:
+        return
+    cache.set(
+        f"{WALLET_SYNC_KEY_PREFIX}{task_id}",
+        int(timezone.now().timestamp()),
+        WALLET_SYNC_TTL,
+    )
+
+
+@task_success.connect
+def corptools_wallet_synced(sender=None, **kwargs):
+    """
+    Settles pending lotteries once their receiving corporation's wallet
+    journal has been refreshed by corptools, with the sync start as cutoff.
+    """
+    if getattr(sender, "name", None) != CORPTOOLS_WALLET_TASK:
+        return
+    key = f"{WALLET_SYNC_KEY_PREFIX}{sender.request.id}"
+    started = cache.get(key)
+    cache.delete(key)
+    if started is None:
+        # Start time unknown: leave the lotteries to check_lottery_status
+        return
+    args = sender.request.args or ()
+    corporation_id = args[0] if args else (sender.request.kwargs or {}).get("corp_id")
+    if not corporation_id:
+        return
+    if not Lottery.objects.filter(
+        status="pending",
+        payment_receiver__corporation_id=corporation_id,
+    ).exists():
+        return
+    logger.info(f"Wallet of corporation {corporation_id} synced, settling lotteries.")
+    settle_pending_lotteries.apply_async(
+        args=[started],
+        kwargs={"corporation_id": corporation_id},
+        countdown=max(
+            0, started + SETTLE_GRACE.total_seconds() - timezone.now().timestamp()
+        ),
+    )
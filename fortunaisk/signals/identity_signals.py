@@ -0,0 +1,22 @@
+# fortunaisk/signals/identity_signals.py
+
+# Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Alliance Auth
+from allianceauth.authentication.models import CharacterOwnership, UserProfile
+
+# fortunaisk
+from fortunaisk.identity import clear_identity_cache
+
+
+@receiver(post_save, sender=CharacterOwnership)
+@receiver(post_delete, sender=CharacterOwnership)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def payer_identity_invalidate(sender, instance, **kwargs):
+    """
+    Ownership or main character changes invalidate the payer identity cache.
+    """
+    clear_identity_cache()
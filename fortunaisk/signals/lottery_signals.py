@@ -3,14 +3,17 @@ import logging
 import random
 
 # Django
-from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
 # fortunaisk
 from fortunaisk.models import Lottery
 from fortunaisk.models.winner_distribution import WinnerDistribution
 from fortunaisk.notifications import build_embed, notify_discord_or_fallback
+from fortunaisk.recipients import admin_recipients
+from fortunaisk.references import invalidate_reference
+from fortunaisk.tasks import schedule_lottery_closure
 
 logger = logging.getLogger(__name__)
 
@@ -18,15 +21,6 @@ logger = logging.getLogger(__name__)
 lottery_created = Signal()
 
 
-def get_admin_users_queryset():
-    """
-    Returns users from the 'can_admin_app' group
-    to send public notifications.
-    """
-    User = get_user_model()
-    return User.objects.filter(groups__permissions__codename="can_admin_app").distinct()
-
-
 @receiver(lottery_created)
 def on_lottery_created(sender, instance, **kwargs):
     """
@@ -95,23 +89,119 @@ def on_lottery_created(sender, instance, **kwargs):
 
     # 4) Send via configured webhooks
     notify_discord_or_fallback(
-        users=get_admin_users_queryset(),
+        users=admin_recipients(),
         event="lottery_created",
         embed=embed,
         private=False,
     )
 
 
-@receiver(pre_save, sender=Lottery)
-def lottery_pre_save(sender, instance, **kwargs):
-    """Save old status to detect transitions later."""
-    if instance.pk:
-        try:
-            instance._old_status = sender.objects.get(pk=instance.pk).status
-        except sender.DoesNotExist:
-            instance._old_status = None
-    else:
-        instance._old_status = None
+@receiver(post_save, sender=Lottery)
+@receiver(post_delete, sender=Lottery)
+def lottery_reference_invalidate(sender, instance, **kwargs):
+    """
+    Drops the lottery from the in-process reference resolver cache.
+    """
+    invalidate_reference(instance.lottery_reference)
+
+
+@receiver(post_save, sender=Lottery)
+def lottery_schedule_closure(sender, instance, created, **kwargs):
+    """
+    Schedules the ACTIVE→PENDING transition at the exact end date,
+    on creation and whenever the end date changes.
+    """
+    if instance.status != "active":
+        return
+    if not created and "end_date" not in instance.changed_fields:
+        return
+    transaction.on_commit(lambda: schedule_lottery_closure(instance))
+
+
+def announce_lottery_completion(instance):
+    """
+    Sends the per-winner DMs and the public podium of a completed lottery.
+
+    Runs once, after the draw transaction has committed, from a single
+    winners query.
+    """
+    # fortunaisk
+    from fortunaisk.models import Winner
+
+    # Winners in rank order, with their users, in a single query
+    winners = list(
+        Winner.objects.filter(ticket__lottery=instance)
+        .select_related("ticket__user")
+        .order_by("pk")
+    )
+
+    # Private DM to every winner
+    for w in winners:
+        embed = build_embed(
+            title="🎉 Congratulations, You Won!",
+            description=(
+                f"Hello {w.ticket.user.username},\n\n"
+                f"You have won {w.prize_amount:,} ISK "
+                f"in lottery {instance.lottery_reference}. Well done!"
+            ),
+            level="success",
+        )
+        notify_discord_or_fallback(
+            users=w.ticket.user,
+            event="lottery_completed",
+            embed=embed,
+            private=True,
+        )
+
+    # Main message
+    lines = [
+        f"🎉 **Lottery {instance.lottery_reference} is finished!** 🎉",
+        "",
+        "Here's the podium 🏆:",
+    ]
+    emojis = ["🥇", "🥈", "🥉"]
+    for idx, w in enumerate(winners, start=1):
+        medal = emojis[idx - 1] if idx <= 3 else f"{idx}."
+        lines.append(
+            f"{medal} **{w.ticket.user.username}** → **{w.prize_amount:,} ISK**"
+        )
+
+    if not winners:
+        lines.append("😢 No tickets sold, no winners this time.")
+
+    description = "\n".join(lines)
+
+    embed = build_embed(
+        title="🏆 Lottery Completed! 🏆",
+        description=description,
+        level="success",
+        fields=[
+            {
+                "name": "📌 Reference",
+                "value": instance.lottery_reference,
+                "inline": True,
+            },
+            {
+                "name": "🗓 Closed on",
+                "value": instance.end_date.strftime("%Y-%m-%d %H:%M"),
+                "inline": True,
+            },
+            {"name": "🥇 Winners", "value": str(len(winners)), "inline": True},
+            {
+                "name": "💰 Total Pool",
+                "value": f"{instance.total_pot:,} ISK",
+                "inline": True,
+            },
+        ],
+        footer={"text": "Thanks for playing! See you on the next adventure ✨"},
+    )
+
+    notify_discord_or_fallback(
+        users=admin_recipients(),
+        event="lottery_completed",
+        embed=embed,
+        private=False,
+    )
 
 
 @receiver(post_save, sender=Lottery)
@@ -119,8 +209,8 @@ def lottery_status_change(sender, instance, created, **kwargs):
     if created:
         return
 
-    admins = get_admin_users_queryset()
-    old = getattr(instance, "_old_status", None)
+    admins = admin_recipients()
+    old = instance.loaded_value("status")
     new = instance.status
 
     # ─── Sales Closed ──────────────────────────────────────────────────────────
@@ -166,63 +256,8 @@ def lottery_status_change(sender, instance, created, **kwargs):
         )
 
     # ─── Lottery Completed ─────────────────────────────────────────────────────
-    if new == "completed":
-        # fortunaisk
-        from fortunaisk.models import Winner
-
-        winners = list(
-            Winner.objects.filter(ticket__lottery=instance).order_by("won_at")
-        )
-
-        # Main message
-        lines = [
-            f"🎉 **Lottery {instance.lottery_reference} is finished!** 🎉",
-            "",
-            "Here's the podium 🏆:",
-        ]
-        emojis = ["🥇", "🥈", "🥉"]
-        for idx, w in enumerate(winners, start=1):
-            medal = emojis[idx - 1] if idx <= 3 else f"{idx}."
-            lines.append(
-                f"{medal} **{w.ticket.user.username}** → **{w.prize_amount:,} ISK**"
-            )
-
-        if not winners:
-            lines.append("😢 No tickets sold, no winners this time.")
-
-        description = "\n".join(lines)
-
-        embed = build_embed(
-            title="🏆 Lottery Completed! 🏆",
-            description=description,
-            level="success",
-            fields=[
-                {
-                    "name": "📌 Reference",
-                    "value": instance.lottery_reference,
-                    "inline": True,
-                },
-                {
-                    "name": "🗓 Closed on",
-                    "value": instance.end_date.strftime("%Y-%m-%d %H:%M"),
-                    "inline": True,
-                },
-                {"name": "🥇 Winners", "value": str(len(winners)), "inline": True},
-                {
-                    "name": "💰 Total Pool",
-                    "value": f"{instance.total_pot:,} ISK",
-                    "inline": True,
-                },
-            ],
-            footer={"text": "Thanks for playing! See you on the next adventure ✨"},
-        )
-
-        notify_discord_or_fallback(
-            users=admins,
-            event="lottery_completed",
-            embed=embed,
-            private=False,
-        )
+    if new == "completed" and old != "completed":
+        transaction.on_commit(lambda: announce_lottery_completion(instance))
 
     # ─── Lottery Cancelled ─────────────────────────────────────────────────────
     if new == "cancelled":
@@ -4,52 +4,31 @@
 import logging
 
 # Django
-from django.contrib.auth import get_user_model
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
 # fortunaisk
 from fortunaisk.models import TicketAnomaly, TicketPurchase, Winner
 from fortunaisk.notifications import build_embed, notify_discord_or_fallback
+from fortunaisk.recipients import admin_recipients
 
 logger = logging.getLogger(__name__)
 
 
-def get_admin_users_queryset():
-    User = get_user_model()
-    return User.objects.filter(groups__permissions__codename="can_admin_app").distinct()
-
-
 # ─── TicketPurchase: track diffs & DM purchaser only ─────────────────────────
 
 
-@receiver(pre_save, sender=TicketPurchase)
-def track_ticketpurchase_old_values(sender, instance, **kwargs):
-    """Before saving, store old quantity and amount."""
-    if instance.pk:
-        try:
-            old = sender.objects.get(pk=instance.pk)
-            instance._old_quantity = old.quantity
-            instance._old_amount = old.amount
-        except sender.DoesNotExist:
-            instance._old_quantity = 0
-            instance._old_amount = 0
-    else:
-        instance._old_quantity = 0
-        instance._old_amount = 0
-
-
 @receiver(post_save, sender=TicketPurchase)
 def notify_ticketpurchase_change(sender, instance, created, **kwargs):
     """
     After saving, if the user has added tickets,
     send them a DM confirming their purchase.
     """
-    old_q = getattr(instance, "_old_quantity", 0)
+    old_q = instance.loaded_value("quantity", 0)
     new_q = instance.quantity
     added_q = new_q - old_q
 
-    old_a = getattr(instance, "_old_amount", 0)
+    old_a = instance.loaded_value("amount", 0)
     new_a = instance.amount
     added_a = new_a - old_a
 
@@ -66,11 +45,22 @@ def notify_ticketpurchase_change(sender, instance, created, **kwargs):
         ),
         level="success",
     )
+    ref = instance.lottery.lottery_reference
     notify_discord_or_fallback(
         users=instance.user,
         event="ticket_purchase",
         embed=embed,
         private=True,
+        digest_key=f"ticket_purchase:user:{instance.user.pk}",
+        digest={
+            "title": "🍀 Ticket Purchases Confirmed",
+            "intro": (
+                f"Hello {instance.user.username}, "
+                "these payments have been processed:"
+            ),
+            "line": f"{added_a:,} ISK for {ref}: {new_q:,} ticket(s) held",
+            "totals": {"Total paid (ISK)": str(added_a), "Tickets bought": added_q},
+        },
     )
 
 
@@ -100,6 +90,13 @@ def on_anomaly_created(sender, instance, created, **kwargs):
         event="anomaly_detected",
         embed=dm_embed,
         private=True,
+        digest_key=f"anomaly_detected:user:{instance.user.pk}",
+        digest={
+            "title": "⚠️ Payment Anomalies Detected",
+            "intro": f"Hello {instance.user.username}, these payments failed:",
+            "line": f"{instance.amount:,} ISK on {lot_ref}: {instance.reason}",
+            "totals": {"Amount (ISK)": str(instance.amount)},
+        },
     )
 
     # Public (admins)
@@ -112,10 +109,19 @@ def on_anomaly_created(sender, instance, created, **kwargs):
         level="warning",
     )
     notify_discord_or_fallback(
-        users=get_admin_users_queryset(),
+        users=admin_recipients(),
         event="anomaly_detected",
         embed=public_embed,
         private=False,
+        digest_key="anomaly_detected:admins",
+        digest={
+            "title": "⚠️ New Payment Anomalies",
+            "line": (
+                f"{instance.user.username}: {instance.amount:,} ISK "
+                f"on {lot_ref}: {instance.reason}"
+            ),
+            "totals": {"Amount (ISK)": str(instance.amount)},
+        },
     )
 
 
@@ -155,7 +161,6 @@ def on_anomaly_resolved(sender, instance, created, **kwargs):
     )
 
     # --- Public confirmation for admins (Discord embed) ---
-    # Reusing get_admin_users_queryset defined above
     public_embed = build_embed(
         title="✅ Anomaly Resolved",
         description=f"Anomaly for {user.username} has been resolved.",
@@ -173,50 +178,24 @@ def on_anomaly_resolved(sender, instance, created, **kwargs):
         )
 
     notify_discord_or_fallback(
-        users=get_admin_users_queryset(),
+        users=admin_recipients(),
         event="anomaly_resolved",
         embed=public_embed,
         private=False,
     )
 
 
-# ─── Winner: DM winner on creation, alert admin when prize distributed ──────
-
-
-@receiver(post_save, sender=Winner)
-def on_winner_created(sender, instance, created, **kwargs):
-    """When a Winner is created, DM the winner."""
-    if not created:
-        return
-
-    embed = build_embed(
-        title="🎉 Congratulations, You Won!",
-        description=(
-            f"Hello {instance.ticket.user.username},\n\n"
-            f"You have won {instance.prize_amount:,} ISK "
-            f"in lottery {instance.ticket.lottery.lottery_reference}. Well done!"
-        ),
-        level="success",
-    )
-    notify_discord_or_fallback(
-        users=instance.ticket.user,
-        event="lottery_completed",
-        embed=embed,
-        private=True,
-    )
+# ─── Winner: alert admin when prize distributed ─────────────────────────────
+# (winner DMs are sent by lottery_signals.announce_lottery_completion)
 
 
 @receiver(pre_save, sender=Winner)
 def on_prize_distributed(sender, instance, **kwargs):
     """When distributed=True is set, DM the winner and send public notification."""
-    if not instance.pk:
-        return
-    try:
-        old = sender.objects.get(pk=instance.pk)
-    except sender.DoesNotExist:
+    if instance._state.adding:
         return
 
-    if not old.distributed and instance.distributed:
+    if not instance.loaded_value("distributed") and instance.distributed:
         # 1. Private notification to winner (keep existing)
         winner_embed = build_embed(
             title="🎁 Prize Distributed",
@@ -235,7 +214,7 @@ def on_prize_distributed(sender, instance, **kwargs):
         )
 
         # 2. Public notification to Discord webhook
-        admin_users = get_admin_users_queryset()
+        admin_users = admin_recipients()
 
         # More detailed embed for public announcement
         public_embed = build_embed(
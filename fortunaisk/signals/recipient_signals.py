@@ -0,0 +1,51 @@
+# fortunaisk/signals/recipient_signals.py
+
+# Standard Library
+import logging
+
+# Django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+# fortunaisk
+from fortunaisk.recipients import clear_admin_recipients
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+def _invalidate():
+    """
+    Clear the admin list now and again on commit, so a list rebuilt by
+    another worker from the not-yet-committed state is not kept.
+    """
+    clear_admin_recipients()
+    transaction.on_commit(clear_admin_recipients)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def admin_recipients_membership_changed(sender, action, **kwargs):
+    """Group membership or group permissions changed."""
+    if action.startswith("post_"):
+        _invalidate()
+        logger.debug(f"Cleared admin recipients ({sender.__name__} {action}).")
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=User)
+def admin_recipients_deleted(sender, instance, **kwargs):
+    """A group or user was deleted (its memberships go without m2m signals)."""
+    _invalidate()
+
+
+@receiver(post_save, sender=User)
+def admin_recipients_user_saved(sender, instance, update_fields=None, **kwargs):
+    """A user was renamed; logins (which only touch last_login) are ignored."""
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    _invalidate()
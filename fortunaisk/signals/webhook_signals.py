@@ -4,23 +4,26 @@
 import logging
 
 # Django
-from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 # fortunaisk
 from fortunaisk.models import WebhookConfiguration
+from fortunaisk.routing import clear_webhook_routes
 
 logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=WebhookConfiguration)
-def clear_webhook_cache_on_save(sender, instance, **kwargs):
-    cache.delete("discord_webhook_url")
-    logger.info("Cleared cached Discord webhook URL (updated).")
-
-
 @receiver(post_delete, sender=WebhookConfiguration)
-def clear_webhook_cache_on_delete(sender, instance, **kwargs):
-    cache.delete("discord_webhook_url")
-    logger.info("Cleared cached Discord webhook URL (deleted).")
+def webhook_routes_invalidate(sender, instance, **kwargs):
+    """
+    Any webhook configuration change invalidates the event routing map.
+
+    The map is cleared again on commit, so a map rebuilt by another worker
+    from the not-yet-committed state is not kept.
+    """
+    clear_webhook_routes()
+    transaction.on_commit(clear_webhook_routes)
+    logger.info(f"Cleared webhook routing map ({instance.name or instance.pk}).")
@@ -0,0 +1,225 @@
+# fortunaisk/simulation.py
+
+# Standard Library
+import logging
+from decimal import Decimal
+from typing import NamedTuple
+
+# Django
+from django.core.exceptions import ImproperlyConfigured
+
+# fortunaisk
+from fortunaisk.draw import prize_allocations
+
+try:
+    # Third Party
+    import numpy as np
+except ImportError:  # optional dependency, see the "simulator" extra
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the (draws x purchases) cells held in memory per chunk
+CHUNK_CELLS = 4_000_000
+
+
+class ParticipantOdds(NamedTuple):
+    """Simulated outcome of one participant."""
+
+    label: str
+    tickets: int
+    cost: Decimal
+    win_probability: float
+    expected_payout: float
+    expected_return: float
+    payout_std: float
+
+
+def numpy_available() -> bool:
+    """Whether the simulator can run (NumPy is installed)."""
+    return np is not None
+
+
+def _draw_indices(rng, cdf, weights, k, m, distinct):
+    """
+    Winning purchase indices for `m` simulated draws, shape (m, k).
+
+    Same semantics as `Lottery.select_winners`: with replacement each
+    winner is a uniform ticket in `[0, total)` resolved to the purchase
+    owning it; distinct draws keep the k largest Efraimidis–Spirakis keys
+    `log(u) / weight`, ranked from the largest.
+    """
+    n = len(weights)
+    if not distinct:
+        tickets = rng.random((m, k)) * cdf[-1]
+        return np.searchsorted(cdf, tickets, side="right")
+
+    keys = np.log1p(-rng.random((m, n))) / weights
+    if k < n:
+        top = np.argpartition(keys, n - k, axis=1)[:, n - k :]
+    else:
+        top = np.broadcast_to(np.arange(n), (m, n))
+    order = np.argsort(-np.take_along_axis(keys, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def simulate_odds(
+    participants,
+    pot,
+    winner_count,
+    percentages=(),
+    draw_mode="replacement",
+    draws=100_000,
+    seed=None,
+):
+    """
+    Monte Carlo estimate of every participant's odds for a ticket distribution.
+
+    Each draw picks winners exactly like `Lottery.select_winners` and pays
+    them with `prize_allocations`. Draws are generated in vectorized chunks
+    of at most `CHUNK_CELLS` cells; only per-participant sums are kept.
+
+    Args:
+        participants: Iterable of (label, tickets, cost) per participant
+        pot: Net pot to distribute (Decimal)
+        winner_count: Number of winners per draw
+        percentages: Prize percentage per winner rank
+        draw_mode: "replacement" or "distinct", as on `Lottery`
+        draws: Number of simulated draws
+        seed: Optional seed for reproducible results
+
+    Returns:
+        list: ParticipantOdds, most tickets first
+
+    Raises:
+        ImproperlyConfigured: NumPy is not installed
+    """
+    if np is None:
+        raise ImproperlyConfigured(
+            "The odds simulator requires NumPy (pip install fortunaisk[simulator])."
+        )
+    participants = [p for p in participants if p[1] > 0]
+    if not participants or winner_count <= 0 or draws <= 0:
+        return []
+
+    distinct = draw_mode == "distinct"
+    weights = np.array([tickets for _, tickets, _ in participants], dtype=np.float64)
+    cdf = np.cumsum(weights)
+    n = len(participants)
+    k = min(winner_count, n) if distinct else winner_count
+    prizes = np.array(
+        [float(share) for share in prize_allocations(pot, percentages, k)]
+    )
+
+    wins = np.zeros(n)
+    payout = np.zeros(n)
+    payout_sq = np.zeros(n)
+    rng = np.random.default_rng(seed)
+    chunk = max(1, CHUNK_CELLS // max(n, k))
+    done = 0
+    while done < draws:
+        m = min(chunk, draws - done)
+        picks = _draw_indices(rng, cdf, weights, k, m, distinct)
+        cells = (np.arange(m)[:, None] * n + picks).ravel()
+        per_draw = np.bincount(
+            cells, weights=np.tile(prizes, m), minlength=m * n
+        ).reshape(m, n)
+        hits = np.bincount(cells, minlength=m * n).reshape(m, n)
+        wins += (hits > 0).sum(axis=0)
+        payout += per_draw.sum(axis=0)
+        payout_sq += np.square(per_draw).sum(axis=0)
+        done += m
+
+    mean = payout / draws
+    std = np.sqrt(np.maximum(payout_sq / draws - np.square(mean), 0.0))
+    results = [
+        ParticipantOdds(
+            label=str(label),
+            tickets=int(tickets),
+            cost=cost,
+            win_probability=float(wins[i] / draws),
+            expected_payout=float(mean[i]),
+            expected_return=float(mean[i]) - float(cost),
+            payout_std=float(std[i]),
+        )
+        for i, (label, tickets, cost) in enumerate(participants)
+    ]
+    return sorted(results, key=lambda odds: -odds.tickets)
+
+
+def simulate_lottery(lottery, draws=100_000, seed=None):
+    """
+    Simulates a lottery with its current processed ticket purchases.
+
+    Each purchase (one per character) is a participant, drawn individually
+    as in a real draw.
+
+    Args:
+        lottery: Lottery instance
+        draws: Number of simulated draws
+        seed: Optional seed for reproducible results
+
+    Returns:
+        list: ParticipantOdds per purchasing character
+    """
+    rows = (
+        lottery.ticket_purchases.filter(status="processed")
+        .order_by("id")
+        .values_list(
+            "character__character_name", "user__username", "quantity", "amount"
+        )
+    )
+    participants = [
+        (character or username, quantity, amount)
+        for character, username, quantity, amount in rows
+    ]
+    gross = sum((cost for _, _, cost in participants), Decimal("0.00"))
+    _, pot = lottery.compute_pot(gross)
+    logger.info(
+        f"Simulating {draws} draws of {lottery.lottery_reference} "
+        f"({len(participants)} participants)."
+    )
+    return simulate_odds(
+        participants,
+        pot,
+        lottery.winner_count,
+        lottery.winners_distribution,
+        lottery.draw_mode,
+        draws,
+        seed,
+    )
+
+
+def simulate_synthetic(config, tickets, draws=100_000, seed=None):
+    """
+    Simulates a Lottery or AutoLottery configuration for a synthetic ticket
+    distribution, e.g. to tune an AutoLottery before it runs.
+
+    Args:
+        config: Lottery or AutoLottery providing ticket_price, tax,
+            winner_count, winners_distribution and draw_mode
+        tickets: Ticket count per (hypothetical) participant
+        draws: Number of simulated draws
+        seed: Optional seed for reproducible results
+
+    Returns:
+        list: ParticipantOdds, labelled "Participant N"
+    """
+    # fortunaisk
+    from fortunaisk.models import Lottery
+
+    participants = [
+        (f"Participant {i}", quantity, config.ticket_price * quantity)
+        for i, quantity in enumerate(tickets, start=1)
+    ]
+    gross = config.ticket_price * sum(tickets)
+    _, pot = Lottery(tax=config.tax).compute_pot(gross)
+    return simulate_odds(
+        participants,
+        pot,
+        config.winner_count,
+        [Decimal(str(pct)) for pct in config.winners_distribution or ()],
+        config.draw_mode,
+        draws,
+        seed,
+    )
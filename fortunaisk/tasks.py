@@ -4,7 +4,9 @@
 import json
 import logging
 import math
-from datetime import timedelta
+import zlib
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
 from decimal import Decimal
 
 # Third Party
@@ -13,220 +15,376 @@ from django_celery_beat.models import CrontabSchedule, PeriodicTask
 
 # Django
 from django.apps import apps
+from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import CharField, Count, Exists, F, Min, OuterRef, Q, Sum
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import post_save
 from django.utils import timezone
 
 # fortunaisk
-from fortunaisk.notifications import build_embed, notify_discord_or_fallback
+from fortunaisk import app_settings
+from fortunaisk.draw import prize_allocations
+from fortunaisk.identity import resolve_payers
+from fortunaisk.notifications import (
+    OUTBOX_DRAIN_KEY,
+    Delivery,
+    build_embed,
+    deliver_notifications,
+    merge_digests,
+    notify_discord_or_fallback,
+)
+from fortunaisk.recipients import admin_recipients
+from fortunaisk.references import payment_reference, resolve_lotteries
 
 logger = logging.getLogger(__name__)
 
+# Closures due within this delay are scheduled with an ETA; it must exceed
+# the check_lottery_status interval and stay below the broker's visibility
+# timeout (1 hour by default on Redis)
+CLOSURE_ETA_HORIZON = timedelta(minutes=30)
+
+# Lotteries are settled this long after the wallet sync that covers their
+# end_date started, never on the sync alone
+SETTLE_GRACE = timedelta(minutes=5)
+
+# Follow-up drain of rows waiting for a retry: cache key holding its due
+# time, and the longest delay it is queued with (seconds)
+OUTBOX_RETRY_KEY = "fortunaisk_outbox_retry"
+OUTBOX_RETRY_MAX_DELAY = 600
+
+# Marks payments queued by `_dispatch_payments`, so scans running before
+# their chunk is processed do not queue them again; expires (seconds) to
+# re-queue payments whose chunk was lost
+PAYMENT_QUEUED_KEY_PREFIX = "fortunaisk_payment_queued_"
+PAYMENT_QUEUED_TTL = 600
+
 
 def process_payment(entry):
     """
     Process a single wallet payment into lottery tickets.
 
+    This is a thin wrapper around `process_payment_batch` so that single and
+    batched ingestion share exactly the same business rules.
+
+    Args:
+        entry: CorporationWalletJournalEntry object representing the payment
+    """
+    process_payment_batch([entry])
+
+
+def process_payment_batch(entries, lock=True):
+    """
+    Process a batch of wallet payments into lottery tickets.
+
     This function handles the core business logic for ticket purchases:
-    - Validates the payment record against existing lotteries
+    - Validates the payment records against existing lotteries
     - Handles character and user identification
     - Enforces ticket limits and lottery status rules
     - Creates ticket purchases and records anomalies when needed
-    - Updates the lottery's total pot
+    - Adds the purchased amount to the pot of every touched lottery once
+
+    Payments are first claimed with a single insert-or-ignore of their
+    ProcessedPayment rows (see `ProcessedPayment.claim`), so entries already
+    handled by another run are skipped without a lookup and concurrent workers
+    never process the same entry twice.
+
+    Payers (through the cached identity resolver), lotteries and existing
+    ticket holdings are resolved for the whole batch with set-based queries.
+    Entries are then evaluated in order, in memory, with the same per-entry
+    anomaly rules as the historical single-entry implementation, and the
+    results are written with `bulk_create` and one ticket/pot update per
+    lottery and buyer.
 
     Args:
-        entry: CorporationWalletJournalEntry object representing the payment
+        entries: Iterable of CorporationWalletJournalEntry objects
+        lock: Take row locks on the referenced lotteries. Can be disabled when
+            the caller already serializes all payments of a lottery (see
+            `payment_queue_for`); lotteries no longer "active" are still
+            locked, as their draw does not go through the payment queue.
     """
     ProcessedPayment = apps.get_model("fortunaisk", "ProcessedPayment")
     TicketAnomaly = apps.get_model("fortunaisk", "TicketAnomaly")
     LotteryModel = apps.get_model("fortunaisk", "Lottery")
-    EveCharacter = apps.get_model("eveonline", "EveCharacter")
-    CharacterOwnership = apps.get_model("authentication", "CharacterOwnership")
-    UserProfile = apps.get_model("authentication", "UserProfile")
+    User = get_user_model()
     TicketPurchase = apps.get_model("fortunaisk", "TicketPurchase")
+    TicketCounter = apps.get_model("fortunaisk", "TicketCounter")
 
-    pid = entry.entry_id
-    date = entry.date
-    amt = entry.amount
-    ref = entry.reason.strip()
-
-    # 0) Skip if already processed
-    if ProcessedPayment.objects.filter(payment_id=pid).exists():
-        logger.debug(f"Payment {pid} already processed, skipping.")
+    # Drop duplicates inside the batch, keeping journal order
+    unique = {}
+    for entry in entries:
+        unique.setdefault(str(entry.entry_id), entry)
+    entries = list(unique.values())
+    if not entries:
         return
 
-    # 1) Identify user & character
-    try:
-        char = EveCharacter.objects.get(character_id=entry.first_party_name_id)
-        ownership = CharacterOwnership.objects.get(
-            character__character_id=char.character_id
+    with transaction.atomic():
+        # 0) Identify users & characters for the whole batch
+        identities = resolve_payers({e.first_party_name_id for e in entries})
+        users = User.objects.in_bulk(
+            {who.user_id for who in identities.values() if who.resolved}
         )
-        profile = UserProfile.objects.get(user_id=ownership.user_id)
-        user = profile.user
-    except Exception as e:
-        reason = " | ".join(
-            filter(
-                None,
-                [
-                    (
-                        "EveCharacter missing"
-                        if isinstance(e, EveCharacter.DoesNotExist)
-                        else ""
-                    ),
-                    (
-                        "Ownership missing"
-                        if isinstance(e, CharacterOwnership.DoesNotExist)
-                        else ""
-                    ),
-                    (
-                        "Profile missing"
-                        if isinstance(e, UserProfile.DoesNotExist)
-                        else ""
-                    ),
-                ],
+
+        # 1) Claim the payments: already processed (or concurrently claimed)
+        # entries are skipped by the database itself
+        processed = []
+        for entry in entries:
+            who = identities[entry.first_party_name_id]
+            processed.append(
+                ProcessedPayment(
+                    payment_id=entry.entry_id,
+                    character_id=who.character_pk,
+                    user=users.get(who.user_id) if who.resolved else None,
+                    amount=entry.amount,
+                    payed_at=entry.date,
+                )
             )
-        ) or str(e)
-        TicketAnomaly.objects.create(
-            lottery=None,
-            user=None,
-            character=None,
-            reason=reason,
-            payment_date=date,
-            amount=amt,
-            payment_id=pid,
-        )
-        ProcessedPayment.objects.create(
-            payment_id=pid,
-            character=locals().get("char"),
-            user=locals().get("user"),
-            amount=amt,
-            payed_at=date,
-        )
-        return
+        won = ProcessedPayment.claim(processed)
+        todo = [e for e in entries if str(e.entry_id) in won]
+        skipped = len(entries) - len(todo)
+        if skipped:
+            logger.debug(f"{skipped} payments already processed, skipping.")
+        if not todo:
+            return
 
-    # 2) Retrieve lottery (any status)
-    try:
-        lot = LotteryModel.objects.select_for_update().get(
-            lottery_reference__iexact=ref
-        )
-    except LotteryModel.DoesNotExist:
-        TicketAnomaly.objects.create(
-            lottery=None,
-            user=user,
-            character=char,
-            reason=f"No lottery found with reference '{ref}'",
-            payment_date=date,
-            amount=amt,
-            payment_id=pid,
-        )
-        ProcessedPayment.objects.create(
-            payment_id=pid,
-            character=char,
-            user=user,
-            amount=amt,
-            payed_at=date,
+        # 2) Retrieve and lock referenced lotteries (any status)
+        resolved = resolve_lotteries({payment_reference(e.reason) for e in todo})
+        lottery_qs = LotteryModel.objects.filter(
+            pk__in={ref.id for ref in resolved.values()}
         )
-        return
+        if lock:
+            lottery_qs = lottery_qs.select_for_update()
+        lotteries = {lot.normalized_reference: lot for lot in lottery_qs.order_by("pk")}
+        if not lock:
+            # Draws claim their lottery under a row lock: re-read the lotteries
+            # whose sales are closed locked, so a payment waits for (or makes
+            # skip) an ongoing draw instead of crediting it
+            closed = [lot.pk for lot in lotteries.values() if lot.status != "active"]
+            if closed:
+                lotteries.update(
+                    (lot.normalized_reference, lot)
+                    for lot in LotteryModel.objects.select_for_update()
+                    .filter(pk__in=closed)
+                    .order_by("pk")
+                )
 
-    # 3) Anomaly if completed/cancelled
-    if lot.status in ("completed", "cancelled"):
-        reason = (
-            "Lottery already completed"
-            if lot.status == "completed"
-            else "Lottery has been cancelled"
-        )
-        TicketAnomaly.objects.create(
-            lottery=lot,
-            user=user,
-            character=char,
-            reason=reason,
-            payment_date=date,
-            amount=amt,
-            payment_id=pid,
-        )
-        ProcessedPayment.objects.create(
-            payment_id=pid,
-            character=char,
-            user=user,
-            amount=amt,
-            payed_at=date,
-        )
-        return
+        # Tickets already held per (lottery, user) for limit checks
+        counters = {}
+        if lotteries and users:
+            counters = {
+                (c.lottery_id, c.user_id): c
+                for c in TicketCounter.objects.filter(
+                    lottery__in=lotteries.values(), user_id__in=users.keys()
+                )
+            }
+        held = {key: counter.quantity for key, counter in counters.items()}
 
-    # 4) Out-of-window payment
-    if not (lot.start_date <= date <= lot.end_date):
-        TicketAnomaly.objects.create(
-            lottery=lot,
-            user=user,
-            character=char,
-            reason="Payment outside lottery period",
-            payment_date=date,
-            amount=amt,
-            payment_id=pid,
-        )
-        ProcessedPayment.objects.create(
-            payment_id=pid,
-            character=char,
-            user=user,
-            amount=amt,
-            payed_at=date,
-        )
-        return
+        anomalies, limit_hits = [], []
+        purchases = {}
+        pot_deltas = {}
+        counter_deltas = {}
 
-    # 5) Compute ticket count
-    price = lot.ticket_price
-    count = math.floor(amt / price)
-    if count < 1:
-        TicketAnomaly.objects.create(
-            lottery=lot,
-            user=user,
-            character=char,
-            reason="Insufficient funds for one ticket",
-            payment_date=date,
-            amount=amt,
-            payment_id=pid,
-        )
-        ProcessedPayment.objects.create(
-            payment_id=pid,
-            character=char,
-            user=user,
-            amount=amt,
-            payed_at=date,
-        )
-        return
+        for entry in todo:
+            pid = entry.entry_id
+            date = entry.date
+            amt = entry.amount
+            ref = (entry.reason or "").strip()
 
-    # 6) Enforce per-user limit
-    existing = (
-        TicketPurchase.objects.filter(
-            lottery=lot, user=user, character__id=profile.main_character_id
-        ).aggregate(total=Sum("quantity"))["total"]
-        or 0
-    )
-    final = (
-        count
-        if lot.max_tickets_per_user is None
-        else min(count, max(0, lot.max_tickets_per_user - existing))
-    )
-    if final < 1:
-        TicketAnomaly.objects.create(
-            lottery=lot,
-            user=user,
-            character=char,
-            reason="Ticket limit exceeded",
-            payment_date=date,
-            amount=amt,
-            payment_id=pid,
-        )
-        ProcessedPayment.objects.create(
-            payment_id=pid,
-            character=char,
-            user=user,
-            amount=amt,
-            payed_at=date,
-        )
+            who = identities[entry.first_party_name_id]
+            user = users.get(who.user_id) if who.resolved else None
+
+            payer = {
+                "character_id": who.character_pk,
+                "user": user,
+                "payment_date": date,
+                "payment_id": pid,
+            }
+            # 1) Unidentified payer
+            if user is None:
+                anomalies.append(
+                    TicketAnomaly(
+                        lottery=None,
+                        user=None,
+                        character=None,
+                        reason=who.failure or "Ownership missing",
+                        payment_date=date,
+                        amount=amt,
+                        payment_id=pid,
+                    )
+                )
+                continue
+
+            # 2) Unknown reference
+            lot = lotteries.get(payment_reference(ref))
+            if lot is None:
+                anomalies.append(
+                    TicketAnomaly(
+                        lottery=None,
+                        reason=f"No lottery found with reference '{ref}'",
+                        amount=amt,
+                        **payer,
+                    )
+                )
+                continue
+
+            # 3) Anomaly if completed/cancelled
+            if lot.status in ("completed", "cancelled"):
+                reason = (
+                    "Lottery already completed"
+                    if lot.status == "completed"
+                    else "Lottery has been cancelled"
+                )
+                anomalies.append(
+                    TicketAnomaly(lottery=lot, reason=reason, amount=amt, **payer)
+                )
+                continue
+
+            # 4) Out-of-window payment
+            if not (lot.start_date <= date <= lot.end_date):
+                anomalies.append(
+                    TicketAnomaly(
+                        lottery=lot,
+                        reason="Payment outside lottery period",
+                        amount=amt,
+                        **payer,
+                    )
+                )
+                continue
+
+            # 5) Compute ticket count
+            price = lot.ticket_price
+            count = math.floor(amt / price)
+            if count < 1:
+                anomalies.append(
+                    TicketAnomaly(
+                        lottery=lot,
+                        reason="Insufficient funds for one ticket",
+                        amount=amt,
+                        **payer,
+                    )
+                )
+                continue
+
+            # 6) Enforce per-user limit
+            existing = held.get((lot.pk, user.pk), 0)
+            final = (
+                count
+                if lot.max_tickets_per_user is None
+                else min(count, max(0, lot.max_tickets_per_user - existing))
+            )
+            if final < 1:
+                anomalies.append(
+                    TicketAnomaly(
+                        lottery=lot,
+                        reason="Ticket limit exceeded",
+                        amount=amt,
+                        **payer,
+                    )
+                )
+                limit_hits.append((user, lot))
+                continue
+
+            # 7) Accumulate the TicketPurchase delta
+            gross_cost = price * final
+            held[(lot.pk, user.pk)] = existing + final
+            counter_deltas[(lot.pk, user.pk)] = (
+                counter_deltas.get((lot.pk, user.pk), 0) + final
+            )
+            key = (lot.pk, user.pk, who.character_pk)
+            delta = purchases.setdefault(
+                key,
+                {
+                    "lottery": lot,
+                    "user": user,
+                    "character_id": who.character_pk,
+                    "quantity": 0,
+                    "amount": Decimal("0"),
+                },
+            )
+            delta["quantity"] += final
+            delta["amount"] += gross_cost
+            delta["payment_id"] = pid
+            pot_deltas[lot.pk] = pot_deltas.get(lot.pk, Decimal("0")) + gross_cost
+
+            # 8) Overpayment anomaly
+            remainder = amt - gross_cost
+            if remainder > 0:
+                anomalies.append(
+                    TicketAnomaly(
+                        lottery=lot,
+                        reason=f"Overpayment of {remainder} ISK",
+                        amount=remainder,
+                        **payer,
+                    )
+                )
+
+        # 9) Apply ticket deltas once per (lottery, user, character)
+        if purchases:
+            current = {
+                (p.lottery_id, p.user_id, p.character_id): p
+                for p in TicketPurchase.objects.filter(
+                    lottery_id__in={k[0] for k in purchases},
+                    user_id__in={k[1] for k in purchases},
+                    character_id__in={k[2] for k in purchases},
+                )
+            }
+            for key, delta in purchases.items():
+                purchase = current.get(key)
+                if purchase is None:
+                    TicketPurchase.objects.create(
+                        lottery=delta["lottery"],
+                        user=delta["user"],
+                        character_id=delta["character_id"],
+                        quantity=delta["quantity"],
+                        amount=delta["amount"],
+                        status="processed",
+                        payment_id=delta["payment_id"],
+                    )
+                else:
+                    purchase.quantity += delta["quantity"]
+                    purchase.amount += delta["amount"]
+                    purchase.payment_id = delta["payment_id"]
+                    purchase.save(update_fields=["quantity", "amount", "payment_id"])
+
+            # Keep the per-(lottery, user) ticket counters in step
+            new_counters = []
+            for (lot_id, user_id), quantity in counter_deltas.items():
+                counter = counters.get((lot_id, user_id))
+                if counter is None:
+                    new_counters.append(
+                        TicketCounter(
+                            lottery_id=lot_id, user_id=user_id, quantity=quantity
+                        )
+                    )
+                else:
+                    TicketCounter.objects.filter(pk=counter.pk).update(
+                        quantity=F("quantity") + quantity
+                    )
+            TicketCounter.objects.bulk_create(new_counters)
+
+        # 10) Record anomalies
+        TicketAnomaly.objects.bulk_create(anomalies)
+        # bulk_create bypasses post_save: replay it so every anomaly still
+        # triggers its user DM and admin alert.
+        for anomaly in anomalies:
+            post_save.send(
+                sender=TicketAnomaly,
+                instance=anomaly,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=anomaly._state.db,
+            )
+
+        # 11) Apply the gross pot delta once per touched lottery
+        for lot in lotteries.values():
+            if lot.pk in pot_deltas:
+                lot.add_to_pot(pot_deltas[lot.pk])
+
+    for user, lot in limit_hits:
         notify_discord_or_fallback(
-            user=[user],
+            users=[user],
             event="ticket_limit_reached",
             title="⚠️ Ticket Limit Reached",
             message=(
@@ -236,51 +394,6 @@ def process_payment(entry):
             level="warning",
             private=True,
         )
-        return
-
-    # 7) Create or update TicketPurchase
-    gross_cost = price * final
-    purchase, created = TicketPurchase.objects.get_or_create(
-        lottery=lot,
-        user=user,
-        character=char,
-        defaults={
-            "quantity": final,
-            "amount": gross_cost,
-            "status": "processed",
-            "payment_id": pid,
-        },
-    )
-    if not created:
-        purchase.quantity += final
-        purchase.amount += gross_cost
-        purchase.payment_id = pid
-        purchase.save(update_fields=["quantity", "amount", "payment_id"])
-
-    # 8) Overpayment anomaly
-    remainder = amt - (price * final)
-    if remainder > 0:
-        TicketAnomaly.objects.create(
-            lottery=lot,
-            user=user,
-            character=char,
-            reason=f"Overpayment of {remainder} ISK",
-            payment_date=date,
-            amount=remainder,
-            payment_id=pid,
-        )
-
-    # 9) Mark payment processed
-    ProcessedPayment.objects.create(
-        payment_id=pid,
-        character=char,
-        user=user,
-        amount=amt,
-        payed_at=date,
-    )
-
-    # 10) Recompute net pot
-    lot.update_total_pot()
 
 
 @shared_task(bind=True)
@@ -302,125 +415,565 @@ def process_payment_task(self, entry_id):
 
 
 @shared_task(bind=True)
-def check_purchased_tickets(self):
+def process_payment_batch_task(self, entry_ids, partitioned=False):
+    """
+    Asynchronous wrapper for process_payment_batch.
+
+    Loads and locks all wallet entries of the chunk with one query and
+    processes them in a single transaction. If the batch fails, it is rolled
+    back to a savepoint and the entries are retried one by one, each in its
+    own savepoint. An entry that still fails is marked processed with a
+    TicketAnomaly (see `_record_failed_payment`) instead of blocking the rest
+    of the chunk and its lottery. Entries already processed are skipped by
+    the batch engine, so re-delivered chunks are harmless.
+
+    Chunks routed to a payment partition queue are consumed sequentially
+    per lottery, so they run without row locks.
+
+    Args:
+        self: Task instance (Celery standard)
+        entry_ids: IDs of the CorporationWalletJournalEntry rows to process
+        partitioned: True when the chunk was routed by `payment_queue_for`
+    """
+    Journal = apps.get_model("corptools", "CorporationWalletJournalEntry")
+    with transaction.atomic():
+        entries = Journal.objects.filter(entry_id__in=entry_ids)
+        if not partitioned:
+            entries = entries.select_for_update()
+        entries = list(entries.order_by("date", "entry_id"))
+        try:
+            with transaction.atomic():
+                process_payment_batch(entries, lock=not partitioned)
+            return
+        except Exception:
+            logger.exception(
+                f"Payment batch of {len(entries)} entries failed, "
+                "retrying entry by entry."
+            )
+        for entry in entries:
+            try:
+                with transaction.atomic():
+                    process_payment_batch([entry], lock=not partitioned)
+            except Exception:
+                logger.exception(f"Payment {entry.entry_id} failed, recording it.")
+                _record_failed_payment(entry)
+
+
+def _record_failed_payment(entry):
+    """
+    Mark a payment that cannot be processed as handled, with an anomaly.
+
+    Claims its ProcessedPayment so scans stop re-dispatching it and its
+    lottery can settle, and records a TicketAnomaly so an admin can resolve
+    it by hand. Runs in its own savepoint; a failure here is only logged.
+
+    Args:
+        entry: CorporationWalletJournalEntry that failed processing
+    """
+    ProcessedPayment = apps.get_model("fortunaisk", "ProcessedPayment")
+    TicketAnomaly = apps.get_model("fortunaisk", "TicketAnomaly")
+    try:
+        with transaction.atomic():
+            claimed = ProcessedPayment.claim(
+                [
+                    ProcessedPayment(
+                        payment_id=entry.entry_id,
+                        amount=entry.amount,
+                        payed_at=entry.date,
+                    )
+                ]
+            )
+            if not claimed:
+                return
+            ref = resolve_lotteries([payment_reference(entry.reason)])
+            lottery = next(iter(ref.values()), None)
+            TicketAnomaly.objects.create(
+                lottery_id=lottery.id if lottery else None,
+                reason="Payment could not be processed",
+                payment_date=entry.date,
+                amount=entry.amount,
+                payment_id=entry.entry_id,
+            )
+    except Exception:
+        logger.exception(f"Could not record failed payment {entry.entry_id}.")
+
+
+def payment_queue_for(reason):
+    """
+    Return the Celery queue serializing payments for a lottery reference.
+
+    The normalized reference is hashed with CRC32 (stable across processes)
+    onto one of FORTUNAISK_PAYMENT_PARTITIONS queues. Returns None when
+    partitioning is disabled and the default queue should be used.
+
+    Args:
+        reason: Journal reason (or lottery reference) of the payment
+    """
+    partitions = app_settings.FORTUNAISK_PAYMENT_PARTITIONS
+    if not partitions:
+        return None
+    index = zlib.crc32(payment_reference(reason).encode()) % partitions
+    return f"{app_settings.FORTUNAISK_PAYMENT_QUEUE_PREFIX}{index}"
+
+
+def _unprocessed_payments(queryset):
+    """
+    Restrict a journal queryset to lottery payments without a ProcessedPayment.
+
+    Uses a correlated NOT EXISTS anti-join instead of materializing every
+    processed payment id in Python.
+    """
+    Processed = apps.get_model("fortunaisk", "ProcessedPayment")
+    return queryset.filter(reason__icontains="lottery", amount__gt=0).exclude(
+        Exists(
+            Processed.objects.filter(
+                payment_id=Cast(OuterRef("entry_id"), output_field=CharField())
+            )
+        )
+    )
+
+
+def _dispatch_payments(pending):
+    """
+    Enqueue processing of pending journal payments in chunks.
+
+    Payments are routed to their partition queue (see `payment_queue_for`),
+    grouped by lottery reference (then by date) and split into chunks of
+    FORTUNAISK_PAYMENT_CHUNK_SIZE entry ids, one `process_payment_batch_task`
+    message per chunk.
+
+    Payments already queued within the last PAYMENT_QUEUED_TTL seconds are
+    left out, so the scans, closure passes and reconciliation overlapping a
+    backlog send each payment once.
+
+    Args:
+        pending: Iterable of (entry_id, reason) tuples, in journal order
+    """
+    marks = {f"{PAYMENT_QUEUED_KEY_PREFIX}{row[0]}": row for row in pending}
+    queued = cache.get_many(marks.keys())
+    if queued:
+        logger.debug(f"{len(queued)} payments already queued, skipping.")
+    pending = [row for key, row in marks.items() if key not in queued]
+
+    queues = {}
+    for entry_id, reason in pending:
+        queues.setdefault(payment_queue_for(reason), []).append((entry_id, reason))
+
+    size = app_settings.FORTUNAISK_PAYMENT_CHUNK_SIZE
+    signatures = []
+    for queue, rows in queues.items():
+        # sorted() is stable: journal order is kept within each reference
+        rows.sort(key=lambda row: payment_reference(row[1]))
+        entry_ids = [entry_id for entry_id, _reason in rows]
+        for i in range(0, len(entry_ids), size):
+            sig = process_payment_batch_task.s(
+                entry_ids[i : i + size], partitioned=queue is not None
+            )
+            signatures.append(sig.set(queue=queue) if queue else sig)
+
+    if signatures:
+        group(*signatures).apply_async()
+        cache.set_many(
+            dict.fromkeys(marks.keys() - queued.keys(), True), PAYMENT_QUEUED_TTL
+        )
+        logger.info(f"Dispatched {len(pending)} payments in {len(signatures)} chunks.")
+
+
+@shared_task(bind=True)
+def check_purchased_tickets(self, corporation_id=None):
     """
     Periodically scan for unprocessed payments.
 
-    This task searches for any wallet entries containing the word 'lottery'
-    that haven't been processed yet, then creates a group of tasks to process
-    each payment individually.
+    Each receiving corporation keeps a PaymentWatermark (last journal date and
+    entry id scanned). Only the journal tail after that mark is searched for
+    payments mentioning 'lottery', using an indexable range predicate, then
+    the watermark is advanced to the newest journal entry seen. Stragglers
+    inserted behind the watermark are caught by `reconcile_purchased_tickets`.
+
+    Args:
+        self: Task instance (Celery standard)
+        corporation_id: Only scan this EVE corporation (all if None)
     """
     logger.info("Running check_purchased_tickets")
     Journal = apps.get_model("corptools", "CorporationWalletJournalEntry")
-    Processed = apps.get_model("fortunaisk", "ProcessedPayment")
-    processed_ids = set(Processed.objects.values_list("payment_id", flat=True))
-    pending = Journal.objects.filter(reason__icontains="lottery", amount__gt=0).exclude(
-        entry_id__in=processed_ids
+    Division = apps.get_model("corptools", "CorporationWalletDivision")
+    Watermark = apps.get_model("fortunaisk", "PaymentWatermark")
+
+    division_qs = Division.objects.all()
+    if corporation_id:
+        division_qs = division_qs.filter(
+            corporation__corporation__corporation_id=corporation_id
+        )
+    divisions = {}
+    for division_id, corp_id in division_qs.values_list(
+        "id", "corporation__corporation_id"
+    ):
+        divisions.setdefault(corp_id, []).append(division_id)
+
+    for corp_id, division_ids in divisions.items():
+        watermark, _ = Watermark.objects.get_or_create(corporation_id=corp_id)
+        tail = Journal.objects.filter(division_id__in=division_ids)
+        if watermark.last_date:
+            tail = tail.filter(
+                Q(date__gt=watermark.last_date)
+                | Q(date=watermark.last_date, entry_id__gt=watermark.last_entry_id)
+            )
+
+        newest = tail.order_by("-date", "-entry_id").values("date", "entry_id").first()
+        if not newest:
+            continue
+
+        pending = list(
+            _unprocessed_payments(
+                tail.filter(
+                    Q(date__lt=newest["date"])
+                    | Q(date=newest["date"], entry_id__lte=newest["entry_id"])
+                )
+            )
+            .order_by("date", "entry_id")
+            .values_list("entry_id", "reason")
+        )
+        _dispatch_payments(pending)
+
+        watermark.last_date = newest["date"]
+        watermark.last_entry_id = newest["entry_id"]
+        watermark.save(update_fields=["last_date", "last_entry_id", "updated_at"])
+        logger.info(
+            f"Corporation {corp_id}: {len(pending)} new payments, "
+            f"watermark at entry {watermark.last_entry_id}"
+        )
+
+
+@shared_task(bind=True)
+def reconcile_purchased_tickets(self):
+    """
+    Full journal reconciliation.
+
+    Scans the whole journal (ignoring watermarks) for lottery payments that
+    were never processed, e.g. entries synced late with a date behind the
+    watermark. Meant to run at low frequency.
+    """
+    logger.info("Running reconcile_purchased_tickets")
+    Journal = apps.get_model("corptools", "CorporationWalletJournalEntry")
+    pending = list(
+        _unprocessed_payments(Journal.objects.all())
+        .order_by("date", "entry_id")
+        .values_list("entry_id", "reason")
     )
     if pending:
-        group(*(process_payment_task.s(p.entry_id) for p in pending)).apply_async()
+        logger.warning(f"Reconciliation found {len(pending)} unprocessed payments.")
+    _dispatch_payments(pending)
+
+
+def _close_lottery_sales(lottery_id) -> bool:
+    """
+    Move one lottery from ACTIVE to PENDING once its end_date has passed.
+
+    The row is locked so the scheduled closure and the safety-net poller can
+    never both close (and notify) the same lottery.
+
+    Returns:
+        bool: True if the lottery was closed by this call
+    """
+    LotteryModel = apps.get_model("fortunaisk", "Lottery")
+    with transaction.atomic():
+        lot = (
+            LotteryModel.objects.select_for_update()
+            .filter(pk=lottery_id, status="active", end_date__lte=timezone.now())
+            .first()
+        )
+        if lot is None:
+            return False
+        lot.status = "pending"
+        lot.save(update_fields=["status"])
+    logger.info(f"{lot.lottery_reference} → pending")
+    return True
+
+
+def schedule_lottery_closure(lottery):
+    """
+    Schedule `close_lottery_sales` at the exact end_date of a lottery.
+
+    Only closures within `CLOSURE_ETA_HORIZON` are sent with an ETA: on the
+    Redis broker, ETA tasks held longer than the visibility timeout are
+    redelivered, and they are lost when the worker's queue is purged.
+    Later closures are scheduled by `check_lottery_status` once they come
+    within the horizon. Each (lottery, end_date) is scheduled once.
+
+    Args:
+        lottery: Active Lottery instance
+    """
+    end_ts = int(lottery.end_date.timestamp())
+    if lottery.end_date > timezone.now() + CLOSURE_ETA_HORIZON:
+        return
+    key = f"fortunaisk_closure_{lottery.pk}_{end_ts}"
+    if not cache.add(key, True, timeout=CLOSURE_ETA_HORIZON.total_seconds() * 2):
+        return
+    close_lottery_sales.apply_async(args=[lottery.pk, end_ts], eta=lottery.end_date)
+
+
+@shared_task(bind=True)
+def close_lottery_sales(self, lottery_id: int, end_ts: int):
+    """
+    Close ticket sales of a lottery at its end_date.
+
+    Scheduled with an ETA by `schedule_lottery_closure`. Runs for an
+    outdated end_date are no-ops, since the change scheduled its own run; a
+    run delivered early (clock skew, eager mode) leaves the lottery to
+    `check_lottery_status`.
+
+    Args:
+        self: Task instance (Celery standard)
+        lottery_id: ID of the lottery to close
+        end_ts: End date (epoch seconds) the run was scheduled for
+    """
+    LotteryModel = apps.get_model("fortunaisk", "Lottery")
+    lot = LotteryModel.objects.filter(pk=lottery_id, status="active").first()
+    if lot is None or int(lot.end_date.timestamp()) != end_ts:
+        return
+    _close_lottery_sales(lottery_id)
+
+
+def _lottery_references(lotteries) -> dict:
+    """Normalized reference per lottery id (lotteries without one are left out)."""
+    return {
+        lot.pk: lot.normalized_reference
+        for lot in lotteries
+        if lot.normalized_reference
+    }
+
+
+def _unprocessed_lottery_payments(refs, cutoff):
+    """
+    Unprocessed journal payments up to `cutoff` mentioning one of `refs`.
+
+    Args:
+        refs: Normalized lottery references
+        cutoff: Only journal entries dated up to this time are considered
+    """
+    Journal = apps.get_model("corptools", "CorporationWalletJournalEntry")
+    matches = Q()
+    for ref in refs:
+        matches |= Q(reason__icontains=ref)
+    return _unprocessed_payments(Journal.objects.filter(date__lte=cutoff)).filter(
+        matches
+    )
+
+
+def _unpaid_payment_counts(lotteries, cutoff) -> dict:
+    """
+    Count unprocessed journal payments per lottery, in a single query.
+
+    The journal is scanned once, restricted to unprocessed lottery payments
+    (NOT EXISTS anti-join, see `_unprocessed_payments`) whose reason mentions
+    one of the normalized references; one filtered COUNT per lottery is
+    computed in the same pass.
+
+    Args:
+        lotteries: Iterable of Lottery instances
+        cutoff: Only journal entries dated up to this time are considered
+
+    Returns:
+        dict: lottery id -> number of unprocessed payments
+    """
+    refs = _lottery_references(lotteries)
+    if not refs:
+        return {}
+    counts = _unprocessed_lottery_payments(refs.values(), cutoff).aggregate(
+        **{
+            f"lottery_{pk}": Count("pk", filter=Q(reason__icontains=ref))
+            for pk, ref in refs.items()
+        }
+    )
+    return {pk: counts[f"lottery_{pk}"] or 0 for pk in refs}
+
+
+def _complete_pending_lotteries(lotteries, cutoff) -> list:
+    """
+    Complete every PENDING lottery whose payments up to `cutoff` are processed.
+
+    Unprocessed payments of the other lotteries are dispatched right away:
+    `check_purchased_tickets` only reads the journal tail, so an entry synced
+    late with an older date, or left behind by a lost chunk, would
+    otherwise wait for the nightly `reconcile_purchased_tickets`. Entries
+    still queued by an earlier pass are skipped by `_dispatch_payments`.
+
+    Args:
+        lotteries: Iterable of pending Lottery instances
+        cutoff: Journal sync time; payments up to it must all be processed
+
+    Returns:
+        list: References of the lotteries still waiting for payments
+    """
+    lotteries = list(lotteries)
+    unpaid = _unpaid_payment_counts(lotteries, cutoff)
+    waiting, ready = [], []
+    for lot in lotteries:
+        if unpaid.get(lot.pk):
+            logger.info(
+                f"{unpaid[lot.pk]} unprocessed payments for "
+                f"{lot.lottery_reference}, retry later."
+            )
+            waiting.append(lot.lottery_reference)
+            continue
+        ready.append(draw_lottery.s(lot.pk))
+    if ready:
+        group(*ready).apply_async()
+    if waiting:
+        refs = _lottery_references(lot for lot in lotteries if unpaid.get(lot.pk))
+        _dispatch_payments(
+            list(
+                _unprocessed_lottery_payments(refs.values(), cutoff)
+                .order_by("date", "entry_id")
+                .values_list("entry_id", "reason")
+            )
+        )
+    return waiting
+
+
+@shared_task(bind=True)
+def draw_lottery(self, lottery_id: int):
+    """
+    Draw winners and complete one PENDING lottery.
+
+    Dispatched in parallel for every lottery ready to be drawn. The lottery
+    is claimed with `SELECT ... FOR UPDATE SKIP LOCKED` on its "pending" row
+    and drawn in the same transaction, so concurrent runs for the same
+    lottery are no-ops and a draw that dies (exception, killed worker, time
+    limit) rolls back to "pending" with it.
+
+    Args:
+        self: Task instance (Celery standard)
+        lottery_id: ID of the lottery to draw
+    """
+    LotteryModel = apps.get_model("fortunaisk", "Lottery")
+    with transaction.atomic():
+        lot = (
+            LotteryModel.objects.select_for_update(skip_locked=True)
+            .filter(pk=lottery_id, status="pending")
+            .first()
+        )
+        if lot is None:
+            logger.debug(f"Lottery {lottery_id} is not pending, skipping draw.")
+            return
+        _complete_lottery(lot)
+
+
+def _complete_lottery(lot):
+    """
+    Draw winners and complete a lottery claimed by `draw_lottery`.
+
+    Args:
+        lot: Pending Lottery instance, locked by the current transaction
+    """
+    Purchase = apps.get_model("fortunaisk", "TicketPurchase")
+    Winner = apps.get_model("fortunaisk", "Winner")
+
+    raw_winners = (
+        lot.draw_winners() if Purchase.objects.filter(lottery=lot).exists() else []
+    )
+    lot.update_total_pot()
+    allocations = prize_allocations(
+        lot.total_pot, lot.winners_distribution, len(raw_winners)
+    )
+
+    # create winners (announced once, after commit, by the lottery signals)
+    ts = timezone.now()
+    Winner.objects.bulk_create(
+        [
+            Winner(
+                ticket=purchase,
+                character_id=purchase.character_id,
+                prize_amount=prize,
+                won_at=ts,
+                ticket_number=ticket_number,
+            )
+            for (purchase, ticket_number), prize in zip(raw_winners, allocations)
+        ]
+    )
+    lot.status = "completed"
+    lot.save(update_fields=["status"])
+    logger.info(f"{lot.lottery_reference} → completed")
 
 
 @shared_task(bind=True, max_retries=5)
 def check_lottery_status(self):
     """
-    Manage lottery status transitions.
+    Safety net for lottery status transitions.
 
-    This task:
-    1) Transitions ACTIVE→PENDING when end_date ≤ now
+    Closures normally happen event-driven: `close_lottery_sales` runs at each
+    lottery's end_date and `settle_pending_lotteries` runs as soon as the
+    receiving corporation's wallet has been synced. This low-frequency task
+    catches anything those missed:
+    1) Transitions ACTIVE→PENDING when end_date ≤ now, and schedules the
+       closures due within `CLOSURE_ETA_HORIZON`
     2) Waits 5 minutes after the audit task has run
     3) Transitions PENDING→COMPLETED: draws winners, distributes prizes, creates Winner records
 
-    Uses a cache lock to prevent concurrent execution.
+    Each lottery is drawn by its own `draw_lottery` task, claimed with a row
+    lock, so no global lock is needed.
     """
-    lock = "check_lottery_status_lock"
-    if not cache.add(lock, "1", timeout=300):
-        return
+    now = timezone.now()
+    LotteryModel = apps.get_model("fortunaisk", "Lottery")
+
+    # 1) ACTIVE→PENDING
+    for lot_id in LotteryModel.objects.filter(
+        status="active", end_date__lte=now
+    ).values_list("id", flat=True):
+        _close_lottery_sales(lot_id)
+
+    # Closures coming within the ETA horizon get their exact-time run
+    for lot in LotteryModel.objects.filter(
+        status="active", end_date__gt=now, end_date__lte=now + CLOSURE_ETA_HORIZON
+    ).only("pk", "end_date"):
+        schedule_lottery_closure(lot)
+
+    # 2) Wait for audit + 5'
     try:
-        now = timezone.now()
-        LotteryModel = apps.get_model("fortunaisk", "Lottery")
-        Journal = apps.get_model("corptools", "CorporationWalletJournalEntry")
-        Processed = apps.get_model("fortunaisk", "ProcessedPayment")
-        Purchase = apps.get_model("fortunaisk", "TicketPurchase")
-        Winner = apps.get_model("fortunaisk", "Winner")
-        # fortunaisk
-        from fortunaisk.models.winner_distribution import WinnerDistribution
-
-        # 1) ACTIVE→PENDING
-        for lot in LotteryModel.objects.filter(status="active", end_date__lte=now):
-            lot.status = "pending"
-            lot.save(update_fields=["status"])
-            logger.info(f"{lot.lottery_reference} → pending")
-
-        # 2) Wait for audit + 5'
-        try:
-            audit = PeriodicTask.objects.get(name="Corporation Audit Update")
-            last_run = audit.last_run_at
-        except PeriodicTask.DoesNotExist:
-            logger.warning("Audit task not found, delaying closure.")
-            return
-        if not last_run or now < last_run + timedelta(minutes=5):
-            return
+        audit = PeriodicTask.objects.get(name="Corporation Audit Update")
+        last_run = audit.last_run_at
+    except PeriodicTask.DoesNotExist:
+        logger.warning("Audit task not found, delaying closure.")
+        return
+    if not last_run or now < last_run + SETTLE_GRACE:
+        return
 
-        # 3) PENDING→COMPLETED
-        pendings = LotteryModel.objects.filter(status="pending", end_date__lte=last_run)
-        for lot in pendings:
-            unpaid = Journal.objects.filter(
-                reason__iexact=lot.lottery_reference.lower(),
-                amount__gt=0,
-                date__lte=last_run,
-            ).exclude(
-                entry_id__in=Processed.objects.values_list("payment_id", flat=True)
-            )
-            if unpaid.exists():
-                logger.info(
-                    f"Unprocessed payments for {lot.lottery_reference}, retry later."
-                )
-                continue
+    # 3) PENDING→COMPLETED, one draw task per lottery
+    pendings = LotteryModel.objects.filter(status="pending", end_date__lte=last_run)
+    _complete_pending_lotteries(pendings, cutoff=last_run)
 
-            raw_winners = (
-                lot.select_winners()
-                if Purchase.objects.filter(lottery=lot).exists()
-                else []
-            )
-            lot.update_total_pot()
-            pot_net = lot.total_pot
-
-            # build percentages
-            dist_qs = WinnerDistribution.objects.filter(
-                lottery_reference=lot.lottery_reference
-            ).order_by("winner_rank")
-            percentages = [wd.winner_prize_distribution for wd in dist_qs]
-            n_winners = len(raw_winners)
-            if len(percentages) != n_winners and n_winners > 0:
-                base = (Decimal("100") / n_winners).quantize(Decimal("0.01"))
-                percentages = [base] * n_winners
-                percentages[-1] = Decimal("100") - base * (n_winners - 1)
-
-            # compute allocations
-            allocations, cumu = [], Decimal("0")
-            for idx, pct in enumerate(percentages):
-                share = (pot_net * pct / Decimal("100")).quantize(Decimal("0.01"))
-                if idx == n_winners - 1:
-                    share = pot_net - cumu
-                else:
-                    cumu += share
-                allocations.append(share)
-
-            # create winners
-            ts = timezone.now()
-            for purchase, prize in zip(raw_winners, allocations):
-                Winner.objects.create(
-                    ticket=purchase,
-                    character=getattr(purchase, "character", None),
-                    prize_amount=prize,
-                    won_at=ts,
-                )
-            lot.status = "completed"
-            lot.save(update_fields=["status"])
-            logger.info(f"{lot.lottery_reference} → completed")
-    finally:
-        cache.delete(lock)
+
+@shared_task(bind=True, max_retries=10)
+def settle_pending_lotteries(self, synced_at: int, corporation_id=None):
+    """
+    Complete pending lotteries right after a wallet sync.
+
+    Triggered when corptools finished updating a corporation wallet (see
+    `signals/corptools_signals.py`), `SETTLE_GRACE` after the sync started.
+    Only lotteries that ended before the sync started are settled: payments
+    made later may be missing from the fetched journal. The corporation's
+    new payments are processed first; while some are still in flight the
+    task retries shortly after instead of waiting for the next
+    `check_lottery_status` run.
+
+    Args:
+        self: Task instance (Celery standard)
+        synced_at: Start of the wallet sync (epoch seconds)
+        corporation_id: EVE corporation whose wallet was synced (all if None)
+    """
+    LotteryModel = apps.get_model("fortunaisk", "Lottery")
+    synced_at = datetime.fromtimestamp(synced_at, tz=dt_timezone.utc)
+    pendings = LotteryModel.objects.filter(status="pending", end_date__lte=synced_at)
+    if corporation_id:
+        pendings = pendings.filter(payment_receiver__corporation_id=corporation_id)
+    if not pendings.exists():
+        return
+
+    check_purchased_tickets(corporation_id=corporation_id)
+
+    waiting = _complete_pending_lotteries(pendings, cutoff=synced_at)
+    if waiting:
+        raise self.retry(countdown=60)
 
 
 @shared_task(bind=True)
@@ -492,11 +1045,7 @@ def send_lottery_closure_reminders(self):
     if not upcoming.exists():
         return
 
-    admins = (
-        apps.get_model("auth", "User")
-        .objects.filter(groups__permissions__codename="can_admin_app")
-        .distinct()
-    )
+    admins = admin_recipients()
 
     for lot in upcoming:
         # Get current pot for promotion
@@ -528,14 +1077,182 @@ def send_lottery_closure_reminders(self):
         logger.info("Sent 24h reminder for %s", lot.lottery_reference)
 
 
+@shared_task(bind=True)
+def reconcile_pots(self, fix: bool = True):
+    """
+    Recompute lottery pots from scratch and report drift.
+
+    The hot payment path maintains pots incrementally (`Lottery.add_to_pot`).
+    This task recomputes gross, tax and net pot of every active or pending
+    lottery from its ticket purchases in one aggregate query and, when `fix`
+    is True, overwrites drifting values.
+
+    Args:
+        self: Task instance (Celery standard)
+        fix: Whether drifting pots should be corrected
+
+    Returns:
+        list: One dict per drifting lottery (reference, stored and expected
+        tax_amount/total_pot)
+    """
+    LotteryModel = apps.get_model("fortunaisk", "Lottery")
+    lotteries = LotteryModel.objects.filter(status__in=["active", "pending"]).annotate(
+        gross=Coalesce(Sum("ticket_purchases__amount"), Decimal("0.00"))
+    )
+    drifts = []
+    for lot in lotteries:
+        tax_amt, net = lot.compute_pot(lot.gross)
+        if (tax_amt, net) == (lot.tax_amount, lot.total_pot):
+            continue
+        drifts.append(
+            {
+                "lottery_reference": lot.lottery_reference,
+                "stored_tax_amount": str(lot.tax_amount),
+                "stored_total_pot": str(lot.total_pot),
+                "expected_tax_amount": str(tax_amt),
+                "expected_total_pot": str(net),
+            }
+        )
+        logger.warning(
+            f"Pot drift on {lot.lottery_reference}: stored {lot.total_pot} "
+            f"(tax {lot.tax_amount}), expected {net} (tax {tax_amt})"
+        )
+        if fix:
+            LotteryModel.objects.filter(pk=lot.pk).update(
+                tax_amount=tax_amt, total_pot=net
+            )
+    return drifts
+
+
+@shared_task(bind=True)
+def drain_notification_outbox(self):
+    """
+    Deliver queued notifications in batches.
+
+    Rows due for delivery are locked with `SKIP LOCKED`, so concurrent
+    drains split the work instead of waiting on each other, and each batch
+    is delivered by `deliver_notifications` (packed per webhook). Rows
+    sharing a digest key are merged into one message with `merge_digests`
+    once the first of them is due. Delivered rows are deleted; rate-limited
+    rows wait for their webhook's window; a failed row is retried with
+    exponential backoff until `FORTUNAISK_OUTBOX_MAX_ATTEMPTS`, then marked
+    "failed". Rows left waiting get one follow-up drain when the first of
+    them is due (see `_schedule_outbox_retry`).
+
+    Args:
+        self: Task instance (Celery standard)
+
+    Returns:
+        tuple: (delivered, retried or failed) row counts
+    """
+    # Rows committed from now on queue a new drain
+    cache.delete(OUTBOX_DRAIN_KEY)
+    Outbox = apps.get_model("fortunaisk", "NotificationOutbox")
+    User = get_user_model()
+    batch_size = app_settings.FORTUNAISK_OUTBOX_BATCH_SIZE
+    delivered = failed = 0
+
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Outbox.objects.select_for_update(skip_locked=True)
+                .filter(status="pending", next_attempt_at__lte=timezone.now())
+                .order_by("id")[:batch_size]
+            )
+            due = len(rows)
+            # Pending rows joining the digest of a due row go out with it
+            digest_keys = {row.digest_key for row in rows if row.digest_key}
+            if digest_keys:
+                rows += list(
+                    Outbox.objects.select_for_update(skip_locked=True)
+                    .filter(status="pending", digest_key__in=digest_keys)
+                    .exclude(pk__in=[row.pk for row in rows])
+                )
+            groups = merge_digests(rows)
+            carriers = [carrier for carrier, _ in groups]
+            users = User.objects.in_bulk(
+                {pk for row in carriers for pk in row.recipient_ids}
+            )
+            try:
+                outcome = deliver_notifications(carriers, users)
+            except Exception as exc:
+                logger.exception("Delivery of a notification batch failed.")
+                outcome = {row.pk: Delivery(False, error=str(exc)) for row in carriers}
+            done, retry = [], []
+            for row, members in groups:
+                delivery = outcome[row.pk]
+                if delivery.done:
+                    done.extend(member.pk for member in members)
+                    continue
+                row.last_error = delivery.error
+                if delivery.retry_at:
+                    # Rate limited: wait for the window, not an attempt
+                    row.next_attempt_at = delivery.retry_at
+                else:
+                    row.attempts += 1
+                    if row.attempts >= app_settings.FORTUNAISK_OUTBOX_MAX_ATTEMPTS:
+                        row.status = "failed"
+                    else:
+                        delay = min(30 * 2 ** (row.attempts - 1), 3600)
+                        row.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+                retry.append(row)
+            Outbox.objects.filter(pk__in=done).delete()
+            Outbox.objects.bulk_update(
+                retry,
+                ["attempts", "status", "next_attempt_at", "last_error", "webhook_ids"],
+            )
+        delivered += len(done)
+        failed += len(retry)
+        if due < batch_size:
+            break
+
+    next_due = Outbox.objects.filter(status="pending").aggregate(
+        due=Min("next_attempt_at")
+    )["due"]
+    if next_due:
+        _schedule_outbox_retry(next_due)
+
+    if delivered or failed:
+        logger.info(f"Notification outbox: {delivered} delivered, {failed} failed.")
+    return delivered, failed
+
+
+def _schedule_outbox_retry(due):
+    """
+    Queue a drain for when the next waiting outbox row is due.
+
+    At most one retry drain is queued at a time, unless a row becomes due
+    before it. The delay is capped at `OUTBOX_RETRY_MAX_DELAY` to keep ETA
+    tasks below the broker's visibility timeout; a drain that finds nothing
+    due simply queues the next one.
+
+    Args:
+        due: next_attempt_at of the earliest pending row
+    """
+    delay = (due - timezone.now()).total_seconds()
+    delay = int(min(max(delay, 1), OUTBOX_RETRY_MAX_DELAY))
+    due_ts = int(due.timestamp())
+    scheduled = cache.get(OUTBOX_RETRY_KEY)
+    if scheduled is not None and scheduled <= due_ts:
+        return
+    cache.set(OUTBOX_RETRY_KEY, due_ts, timeout=delay)
+    drain_notification_outbox.apply_async(countdown=delay)
+
+
 def setup_periodic_tasks():
     """
     Create/update periodic tasks in cron mode:
 
     This function configures the following scheduled tasks:
     - check_purchased_tickets: runs every 30 minutes
-    - check_lottery_status: runs every 2 minutes
+    - reconcile_purchased_tickets: runs daily at 04:15
+    - reconcile_pots: runs daily at 04:30
+    - check_lottery_status: runs every 15 minutes (safety net, closures are
+      scheduled per lottery and triggered by wallet syncs)
     - send_lottery_closure_reminders: runs at the top of every hour
+    - drain_notification_outbox: runs every 15 minutes (deliveries are
+      triggered on commit and retries schedule their own drain; this only
+      catches missed triggers)
     """
     # 1) every 30 min
     sched30, _ = CrontabSchedule.objects.get_or_create(
@@ -552,15 +1269,44 @@ def setup_periodic_tasks():
         },
     )
 
-    # 2) every 2 min
-    sched2, _ = CrontabSchedule.objects.get_or_create(
-        minute="*/2", hour="*", day_of_month="*", month_of_year="*", day_of_week="*"
+    # 1b) daily full reconciliation
+    sched_daily, _ = CrontabSchedule.objects.get_or_create(
+        minute="15", hour="4", day_of_month="*", month_of_year="*", day_of_week="*"
+    )
+    PeriodicTask.objects.update_or_create(
+        name="reconcile_purchased_tickets",
+        defaults={
+            "task": "fortunaisk.tasks.reconcile_purchased_tickets",
+            "crontab": sched_daily,
+            "interval": None,
+            "args": json.dumps([]),
+            "enabled": True,
+        },
+    )
+
+    sched_pots, _ = CrontabSchedule.objects.get_or_create(
+        minute="30", hour="4", day_of_month="*", month_of_year="*", day_of_week="*"
+    )
+    PeriodicTask.objects.update_or_create(
+        name="reconcile_pots",
+        defaults={
+            "task": "fortunaisk.tasks.reconcile_pots",
+            "crontab": sched_pots,
+            "interval": None,
+            "args": json.dumps([]),
+            "enabled": True,
+        },
+    )
+
+    # 2) every 15 min
+    sched15, _ = CrontabSchedule.objects.get_or_create(
+        minute="*/15", hour="*", day_of_month="*", month_of_year="*", day_of_week="*"
     )
     PeriodicTask.objects.update_or_create(
         name="check_lottery_status",
         defaults={
             "task": "fortunaisk.tasks.check_lottery_status",
-            "crontab": sched2,
+            "crontab": sched15,
             "interval": None,
             "args": json.dumps([]),
             "enabled": True,
@@ -582,4 +1328,16 @@ def setup_periodic_tasks():
         },
     )
 
+    # 4) every 15 min
+    PeriodicTask.objects.update_or_create(
+        name="drain_notification_outbox",
+        defaults={
+            "task": "fortunaisk.tasks.drain_notification_outbox",
+            "crontab": sched15,
+            "interval": None,
+            "args": json.dumps([]),
+            "enabled": True,
+        },
+    )
+
     logger.info("FortunaIsk cron tasks registered.")
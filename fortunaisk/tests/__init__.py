@@ -0,0 +1 @@
+# fortunaisk/tests/__init__.py
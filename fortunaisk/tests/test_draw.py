@@ -0,0 +1,171 @@
+# fortunaisk/tests/test_draw.py
+
+# Standard Library
+import math
+import random
+from collections import Counter
+from itertools import permutations
+
+# Django
+from django.test import SimpleTestCase
+
+# fortunaisk
+from fortunaisk.draw import weighted_choices_stream, weighted_sample_stream
+
+WEIGHTS = {"a": 1, "b": 2, "c": 3, "d": 4, "e": 10}
+TRIALS = 20_000
+
+
+def _stream(weights):
+    return list(weights.items())
+
+
+def _ordered_sample_probabilities(weights, k) -> dict:
+    """
+    Exact probability of every ordered k-sample drawn without replacement,
+    each item picked with probability proportional to its weight among the
+    items not drawn yet (the distribution of Efraimidis–Spirakis sampling).
+    """
+    items = [item for item, weight in weights.items() if weight > 0]
+    k = min(k, len(items))
+    probabilities = {}
+    for sample in permutations(items, k):
+        p, left = 1.0, sum(weights[item] for item in items)
+        for item in sample:
+            p *= weights[item] / left
+            left -= weights[item]
+        probabilities[sample] = p
+    return probabilities
+
+
+class DrawDistributionTestCase(SimpleTestCase):
+    """Empirical frequencies of seeded draws against the exact probabilities."""
+
+    def assertFrequency(self, hits, trials, expected, label):
+        # 5 standard deviations: a false failure is a ~1e-6 event per check
+        tolerance = 5 * math.sqrt(expected * (1 - expected) / trials) + 1e-9
+        self.assertAlmostEqual(
+            hits / trials,
+            expected,
+            delta=tolerance,
+            msg=f"{label}: {hits / trials:.4f} vs exact {expected:.4f}",
+        )
+
+
+class TestWeightedChoicesStream(DrawDistributionTestCase):
+    def test_each_draw_follows_the_weights(self):
+        rng = random.Random(1)
+        k = 3
+        total = sum(WEIGHTS.values())
+        per_slot = [Counter() for _ in range(k)]
+        for _ in range(TRIALS):
+            for slot, item in enumerate(
+                weighted_choices_stream(_stream(WEIGHTS), k, rng)
+            ):
+                per_slot[slot][item] += 1
+
+        for slot, counts in enumerate(per_slot):
+            self.assertEqual(sum(counts.values()), TRIALS)
+            for item, weight in WEIGHTS.items():
+                self.assertFrequency(
+                    counts[item], TRIALS, weight / total, f"slot {slot}, {item}"
+                )
+
+    def test_draws_are_independent(self):
+        rng = random.Random(2)
+        weights = {"x": 1, "y": 3}
+        pairs = Counter(
+            tuple(weighted_choices_stream(_stream(weights), 2, rng))
+            for _ in range(TRIALS)
+        )
+        for first in weights:
+            for second in weights:
+                self.assertFrequency(
+                    pairs[(first, second)],
+                    TRIALS,
+                    weights[first] * weights[second] / 16,
+                    f"{first}{second}",
+                )
+
+    def test_k_larger_than_population(self):
+        draws = weighted_choices_stream(_stream({"x": 1, "y": 1}), 50, random.Random(3))
+        self.assertEqual(len(draws), 50)
+        self.assertEqual(set(draws), {"x", "y"})
+
+    def test_zero_weights_never_win(self):
+        rng = random.Random(4)
+        weights = {"zero": 0, "a": 1, "none": None, "b": 2, "negative": -5}
+        for _ in range(2_000):
+            draws = weighted_choices_stream(_stream(weights), 3, rng)
+            self.assertTrue(set(draws) <= {"a", "b"})
+
+    def test_empty_inputs(self):
+        self.assertEqual(weighted_choices_stream([], 3), [])
+        self.assertEqual(weighted_choices_stream([("x", 0), ("y", 0)], 3), [])
+        self.assertEqual(weighted_choices_stream(_stream(WEIGHTS), 0), [])
+
+    def test_seed_reproducible(self):
+        first = weighted_choices_stream(_stream(WEIGHTS), 5, random.Random(5))
+        second = weighted_choices_stream(_stream(WEIGHTS), 5, random.Random(5))
+        self.assertEqual(first, second)
+
+
+class TestWeightedSampleStream(DrawDistributionTestCase):
+    def test_ordered_samples_follow_exact_probabilities(self):
+        rng = random.Random(6)
+        k = 2
+        samples = Counter(
+            tuple(weighted_sample_stream(_stream(WEIGHTS), k, rng))
+            for _ in range(TRIALS)
+        )
+        exact = _ordered_sample_probabilities(WEIGHTS, k)
+        self.assertTrue(set(samples) <= set(exact))
+        for sample, expected in exact.items():
+            self.assertFrequency(samples[sample], TRIALS, expected, str(sample))
+
+    def test_inclusion_probabilities(self):
+        rng = random.Random(7)
+        k = 3
+        included = Counter()
+        for _ in range(TRIALS):
+            sample = weighted_sample_stream(_stream(WEIGHTS), k, rng)
+            self.assertEqual(len(sample), k)
+            self.assertEqual(len(set(sample)), k)
+            included.update(sample)
+
+        exact = Counter()
+        for sample, p in _ordered_sample_probabilities(WEIGHTS, k).items():
+            for item in sample:
+                exact[item] += p
+        for item in WEIGHTS:
+            self.assertFrequency(included[item], TRIALS, exact[item], item)
+
+    def test_k_at_least_population_returns_everyone_once(self):
+        rng = random.Random(8)
+        weights = {"x": 1, "y": 2, "z": 7}
+        first = Counter()
+        for _ in range(TRIALS):
+            sample = weighted_sample_stream(_stream(weights), 5, rng)
+            self.assertCountEqual(sample, weights)
+            first[sample[0]] += 1
+        # The order is still a weighted draw: the first item is a single pick
+        for item, weight in weights.items():
+            self.assertFrequency(first[item], TRIALS, weight / 10, f"first {item}")
+
+    def test_zero_weights_never_sampled(self):
+        rng = random.Random(9)
+        weights = {"zero": 0, "a": 1, "none": None, "b": 2, "negative": -5}
+        for _ in range(2_000):
+            self.assertCountEqual(
+                weighted_sample_stream(_stream(weights), 3, rng), ["a", "b"]
+            )
+
+    def test_empty_inputs(self):
+        self.assertEqual(weighted_sample_stream([], 3), [])
+        self.assertEqual(weighted_sample_stream([("x", 0), ("y", 0)], 3), [])
+        self.assertEqual(weighted_sample_stream(_stream(WEIGHTS), 0), [])
+
+    def test_seed_reproducible(self):
+        first = weighted_sample_stream(_stream(WEIGHTS), 3, random.Random(10))
+        second = weighted_sample_stream(_stream(WEIGHTS), 3, random.Random(10))
+        self.assertEqual(first, second)
@@ -33,6 +33,7 @@ from fortunaisk.models import (
     AutoLottery,
     Lottery,
     TicketAnomaly,
+    TicketCounter,
     TicketPurchase,
     Winner,
     WinnerDistribution,
@@ -75,18 +76,14 @@ def admin_dashboard(request):
         all_lotteries.filter(status__in=["active", "pending"])
         .annotate(
             tickets_sold=Coalesce(
-                Sum(
-                    "ticket_purchases__quantity",
-                    filter=Q(ticket_purchases__status="processed"),
-                ),
+                Sum("ticket_counters__quantity"),
                 0,
                 output_field=IntegerField(),
             ),
             participant_count=Coalesce(
                 Count(
-                    "ticket_purchases__user",
-                    filter=Q(ticket_purchases__status="processed"),
-                    distinct=True,
+                    "ticket_counters",
+                    filter=Q(ticket_counters__quantity__gt=0),
                 ),
                 0,
                 output_field=IntegerField(),
@@ -348,15 +345,14 @@ def delete_auto_lottery(request, autolottery_id):
 @login_required
 @can_access_app
 def lottery(request):
-    active_qs = Lottery.objects.filter(status="active").prefetch_related(
-        "ticket_purchases"
+    active_qs = Lottery.objects.filter(status="active").select_related(
+        "payment_receiver"
     )
-    counts = (
-        TicketPurchase.objects.filter(user=request.user, lottery__in=active_qs)
-        .values("lottery")
-        .annotate(count=Sum("quantity"))
+    user_map = dict(
+        TicketCounter.objects.filter(
+            user=request.user, lottery__in=active_qs
+        ).values_list("lottery_id", "quantity")
     )
-    user_map = {c["lottery"]: c["count"] for c in counts}
 
     info = []
     for lot in active_qs:
@@ -575,12 +571,12 @@ def lottery_detail(request, lottery_id):
         25,
     ).get_page(request.GET.get("winners_page"))
 
-    participant_count = lot.ticket_purchases.values("user").distinct().count()
-    tickets_sold = TicketPurchase.objects.filter(
-        lottery=lot, status="processed"
-    ).aggregate(total=Coalesce(Sum("quantity"), 0, output_field=IntegerField()))[
-        "total"
-    ]
+    counters = lot.ticket_counters.filter(quantity__gt=0).aggregate(
+        participants=Count("id"),
+        tickets=Coalesce(Sum("quantity"), 0, output_field=IntegerField()),
+    )
+    participant_count = counters["participants"]
+    tickets_sold = counters["tickets"]
     distributions = WinnerDistribution.objects.filter(
         lottery_reference=lot.lottery_reference
     ).order_by("winner_rank")